@@ -0,0 +1,103 @@
+-- Migration: Generate and de-duplicate event slugs in the database
+-- Date: October 16, 2026
+-- Description: Adds a BEFORE INSERT/UPDATE trigger that fills in missing slugs from title + year
+--              and disambiguates collisions using the row id, plus a unique index on slug.
+--              Replaces the application-side get_by_slug probing loop (one round trip per probe).
+-- Applies to: BOTH test.events and prod.events schemas
+
+-- ============================================================================
+-- PHASE 1: TRIGGER FUNCTION (shared, lives in public schema)
+-- ============================================================================
+
+-- Slug rules match EventService._slugify / _build_slug:
+--   lowercase, runs of non-alphanumerics -> single '-', trimmed of leading/trailing '-',
+--   year appended when it is not already part of the title.
+-- Collisions append the first 8 characters of the row id, which is unique by construction,
+-- so no retry loop is needed.
+CREATE OR REPLACE FUNCTION public.event_slug_tg()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+AS $$
+DECLARE
+  event_year TEXT;
+  taken BOOLEAN;
+BEGIN
+  IF TG_OP = 'UPDATE' AND NEW.slug IS NOT DISTINCT FROM OLD.slug THEN
+    RETURN NEW;
+  END IF;
+
+  IF NEW.slug IS NULL OR NEW.slug = '' THEN
+    event_year := EXTRACT(YEAR FROM NEW.date_time AT TIME ZONE 'UTC')::INT::TEXT;
+    NEW.slug := trim(
+      BOTH '-' FROM regexp_replace(
+        lower(CASE WHEN position(event_year IN NEW.title) > 0 THEN NEW.title ELSE NEW.title || ' ' || event_year END),
+        '[^a-z0-9]+', '-', 'g'
+      )
+    );
+  END IF;
+
+  EXECUTE format('SELECT EXISTS (SELECT 1 FROM %I.%I WHERE slug = $1 AND id <> $2)', TG_TABLE_SCHEMA, TG_TABLE_NAME)
+    INTO taken
+    USING NEW.slug, NEW.id;
+
+  IF taken THEN
+    NEW.slug := NEW.slug || '-' || substr(NEW.id::TEXT, 1, 8);
+  END IF;
+
+  RETURN NEW;
+END;
+$$;
+
+-- ============================================================================
+-- PHASE 2: UNIQUE INDEXES
+-- ============================================================================
+
+-- Enforce uniqueness (guards against concurrent inserts racing past the trigger check)
+CREATE UNIQUE INDEX IF NOT EXISTS events_slug_uidx_test
+ON test.events (slug);
+
+CREATE UNIQUE INDEX IF NOT EXISTS events_slug_uidx_prod
+ON prod.events (slug);
+
+-- ============================================================================
+-- PHASE 3: TRIGGERS
+-- ============================================================================
+
+CREATE TRIGGER events_slug_tg
+BEFORE INSERT OR UPDATE OF slug ON test.events
+FOR EACH ROW EXECUTE FUNCTION public.event_slug_tg();
+
+CREATE TRIGGER events_slug_tg
+BEFORE INSERT OR UPDATE OF slug ON prod.events
+FOR EACH ROW EXECUTE FUNCTION public.event_slug_tg();
+
+-- ============================================================================
+-- NOTES
+-- ============================================================================
+
+-- IMPORTANT:
+-- 1. Existing slugs are untouched; run the duplicate check below before creating the index
+-- 2. The API still sends a base slug (title + year); the trigger only fills gaps and resolves collisions
+-- 3. Re-saving a disambiguated event is stable: the suffix is derived from the id, so it never changes
+
+-- ============================================================================
+-- VERIFICATION QUERIES
+-- ============================================================================
+
+-- Check for duplicate slugs before creating the unique index (should return 0 rows)
+-- SELECT slug, COUNT(*) FROM test.events GROUP BY slug HAVING COUNT(*) > 1;
+-- SELECT slug, COUNT(*) FROM prod.events GROUP BY slug HAVING COUNT(*) > 1;
+
+-- Verify triggers exist
+-- SELECT event_object_schema, trigger_name FROM information_schema.triggers
+-- WHERE trigger_name = 'events_slug_tg';
+
+-- ============================================================================
+-- ROLLBACK SCRIPT (run only if migration fails)
+-- ============================================================================
+
+-- DROP TRIGGER IF EXISTS events_slug_tg ON test.events;
+-- DROP TRIGGER IF EXISTS events_slug_tg ON prod.events;
+-- DROP INDEX IF EXISTS test.events_slug_uidx_test;
+-- DROP INDEX IF EXISTS prod.events_slug_uidx_prod;
+-- DROP FUNCTION IF EXISTS public.event_slug_tg();
@@ -0,0 +1,68 @@
+-- Migration: Merge auth user metadata server-side
+-- Date: October 16, 2026
+-- Description: Adds merge_auth_user_metadata(uid, patch), which merges a JSONB patch into
+--              auth.users.raw_user_meta_data in a single statement. Replaces the
+--              get_user_by_id + update_user_by_id round trips (and their read-modify-write race)
+--              in UserService._sync_auth_metadata.
+-- Applies to: BOTH test and prod schemas
+
+-- ============================================================================
+-- PHASE 1: FUNCTIONS
+-- ============================================================================
+
+-- SECURITY DEFINER so the function can write auth.users; execution is restricted to service_role below
+CREATE OR REPLACE FUNCTION test.merge_auth_user_metadata(uid UUID, patch JSONB)
+RETURNS VOID
+LANGUAGE sql
+SECURITY DEFINER
+SET search_path = ''
+AS $$
+  UPDATE auth.users
+  SET raw_user_meta_data = coalesce(raw_user_meta_data, '{}'::jsonb) || patch
+  WHERE id = uid;
+$$;
+
+CREATE OR REPLACE FUNCTION prod.merge_auth_user_metadata(uid UUID, patch JSONB)
+RETURNS VOID
+LANGUAGE sql
+SECURITY DEFINER
+SET search_path = ''
+AS $$
+  UPDATE auth.users
+  SET raw_user_meta_data = coalesce(raw_user_meta_data, '{}'::jsonb) || patch
+  WHERE id = uid;
+$$;
+
+-- ============================================================================
+-- PHASE 2: PERMISSIONS
+-- ============================================================================
+
+REVOKE ALL ON FUNCTION test.merge_auth_user_metadata(UUID, JSONB) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION test.merge_auth_user_metadata(UUID, JSONB) TO service_role;
+
+REVOKE ALL ON FUNCTION prod.merge_auth_user_metadata(UUID, JSONB) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION prod.merge_auth_user_metadata(UUID, JSONB) TO service_role;
+
+-- ============================================================================
+-- NOTES
+-- ============================================================================
+
+-- IMPORTANT:
+-- 1. `||` is a shallow merge, same as the previous {**current, **patch} in Python
+-- 2. The merge happens inside one UPDATE, so concurrent updates no longer overwrite each other's keys
+-- 3. Only the service role (admin client) may call these functions
+
+-- ============================================================================
+-- VERIFICATION QUERIES
+-- ============================================================================
+
+-- Verify functions exist
+-- SELECT routine_schema, routine_name FROM information_schema.routines
+-- WHERE routine_name = 'merge_auth_user_metadata';
+
+-- ============================================================================
+-- ROLLBACK SCRIPT (run only if migration fails)
+-- ============================================================================
+
+-- DROP FUNCTION IF EXISTS test.merge_auth_user_metadata(UUID, JSONB);
+-- DROP FUNCTION IF EXISTS prod.merge_auth_user_metadata(UUID, JSONB);
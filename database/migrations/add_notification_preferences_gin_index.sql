@@ -0,0 +1,46 @@
+-- Migration: GIN index on users.notification_preferences
+-- Date: October 16, 2026
+-- Description: UserRepository.get_users_with_notification_enabled now filters with JSONB containment
+--              (notification_preferences @> '{"rsvp_changes": true}') instead of ->> extraction.
+--              A jsonb_path_ops GIN index answers @> without scanning every user.
+-- Applies to: BOTH test.users and prod.users schemas
+
+-- ============================================================================
+-- PHASE 1: GIN INDEXES
+-- ============================================================================
+
+-- jsonb_path_ops is smaller and faster than the default jsonb_ops, and only supports @>,
+-- which is the only operator used against this column
+CREATE INDEX IF NOT EXISTS users_notification_preferences_gin_idx_test
+ON test.users USING GIN (notification_preferences jsonb_path_ops);
+
+CREATE INDEX IF NOT EXISTS users_notification_preferences_gin_idx_prod
+ON prod.users USING GIN (notification_preferences jsonb_path_ops);
+
+-- ============================================================================
+-- NOTES
+-- ============================================================================
+
+-- IMPORTANT:
+-- 1. Containment matches JSON booleans only: {"rsvp_changes": true} does not match the string "true".
+--    add_notification_preferences.sql and the API both store booleans; run the check below to confirm
+
+-- ============================================================================
+-- VERIFICATION QUERIES
+-- ============================================================================
+
+-- Should return 0 rows (no string-typed boolean preferences)
+-- SELECT id FROM test.users WHERE jsonb_typeof(notification_preferences->'rsvp_changes') <> 'boolean'
+--    OR jsonb_typeof(notification_preferences->'new_application_submitted') <> 'boolean';
+-- SELECT id FROM prod.users WHERE jsonb_typeof(notification_preferences->'rsvp_changes') <> 'boolean'
+--    OR jsonb_typeof(notification_preferences->'new_application_submitted') <> 'boolean';
+
+-- Verify indexes exist
+-- SELECT schemaname, indexname FROM pg_indexes WHERE indexname LIKE 'users_notification_preferences_gin_idx_%';
+
+-- ============================================================================
+-- ROLLBACK SCRIPT (run only if migration fails)
+-- ============================================================================
+
+-- DROP INDEX IF EXISTS test.users_notification_preferences_gin_idx_test;
+-- DROP INDEX IF EXISTS prod.users_notification_preferences_gin_idx_prod;
@@ -0,0 +1,79 @@
+-- Migration: Trigram indexes for user search
+-- Date: October 16, 2026
+-- Description: Supports GET /users?search=... now that the filter runs in PostgreSQL
+--              (ILIKE '%term%' on first_name, last_name, email, display_role combined with OR)
+--              instead of fetching every user and filtering in Python.
+-- Applies to: BOTH test.users and prod.users schemas
+
+-- ============================================================================
+-- PHASE 1: EXTENSION
+-- ============================================================================
+
+-- pg_trgm provides gin_trgm_ops, which lets GIN indexes serve ILIKE '%term%'
+CREATE EXTENSION IF NOT EXISTS pg_trgm WITH SCHEMA extensions;
+
+-- ============================================================================
+-- PHASE 2: TRIGRAM INDEXES (test schema)
+-- ============================================================================
+
+CREATE INDEX IF NOT EXISTS users_first_name_trgm_idx_test
+ON test.users USING GIN (first_name extensions.gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS users_last_name_trgm_idx_test
+ON test.users USING GIN (last_name extensions.gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS users_email_trgm_idx_test
+ON test.users USING GIN (email extensions.gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS users_display_role_trgm_idx_test
+ON test.users USING GIN (display_role extensions.gin_trgm_ops);
+
+-- ============================================================================
+-- PHASE 3: TRIGRAM INDEXES (prod schema)
+-- ============================================================================
+
+CREATE INDEX IF NOT EXISTS users_first_name_trgm_idx_prod
+ON prod.users USING GIN (first_name extensions.gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS users_last_name_trgm_idx_prod
+ON prod.users USING GIN (last_name extensions.gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS users_email_trgm_idx_prod
+ON prod.users USING GIN (email extensions.gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS users_display_role_trgm_idx_prod
+ON prod.users USING GIN (display_role extensions.gin_trgm_ops);
+
+-- ============================================================================
+-- NOTES
+-- ============================================================================
+
+-- IMPORTANT:
+-- 1. Search semantics are unchanged (case-insensitive substring match), so no tsvector column is used;
+--    full-text search would only match whole words
+-- 2. One index per column lets the planner BitmapOr them for the OR filter
+-- 3. Search terms shorter than 3 characters cannot use trigrams and fall back to a sequential scan
+
+-- ============================================================================
+-- VERIFICATION QUERIES
+-- ============================================================================
+
+-- Verify indexes exist
+-- SELECT schemaname, indexname FROM pg_indexes WHERE indexname LIKE 'users_%_trgm_idx_%';
+
+-- Check the plan uses the indexes
+-- EXPLAIN SELECT * FROM test.users
+-- WHERE first_name ILIKE '%john%' OR last_name ILIKE '%john%' OR email ILIKE '%john%' OR display_role ILIKE '%john%';
+
+-- ============================================================================
+-- ROLLBACK SCRIPT (run only if migration fails)
+-- ============================================================================
+
+-- DROP INDEX IF EXISTS test.users_first_name_trgm_idx_test;
+-- DROP INDEX IF EXISTS test.users_last_name_trgm_idx_test;
+-- DROP INDEX IF EXISTS test.users_email_trgm_idx_test;
+-- DROP INDEX IF EXISTS test.users_display_role_trgm_idx_test;
+-- DROP INDEX IF EXISTS prod.users_first_name_trgm_idx_prod;
+-- DROP INDEX IF EXISTS prod.users_last_name_trgm_idx_prod;
+-- DROP INDEX IF EXISTS prod.users_email_trgm_idx_prod;
+-- DROP INDEX IF EXISTS prod.users_display_role_trgm_idx_prod;
@@ -0,0 +1,55 @@
+-- Migration: Indexes for the users list ordering and keyset pagination
+-- Date: October 16, 2026
+-- Description: GET /users orders by (created_at DESC, id DESC), optionally filtered by
+--              department_id and role, and pages with a keyset cursor on (created_at, id).
+--              These indexes let each page be read in order without sorting or OFFSET scans.
+-- Applies to: BOTH test.users and prod.users schemas
+
+-- ============================================================================
+-- PHASE 1: INDEXES (test schema)
+-- ============================================================================
+
+-- Unfiltered list and keyset cursor
+CREATE INDEX IF NOT EXISTS users_created_id_idx_test
+ON test.users (created_at DESC, id DESC);
+
+-- List filtered by department and/or role
+CREATE INDEX IF NOT EXISTS users_dept_role_created_idx_test
+ON test.users (department_id, role, created_at DESC, id DESC);
+
+-- ============================================================================
+-- PHASE 2: INDEXES (prod schema)
+-- ============================================================================
+
+CREATE INDEX IF NOT EXISTS users_created_id_idx_prod
+ON prod.users (created_at DESC, id DESC);
+
+CREATE INDEX IF NOT EXISTS users_dept_role_created_idx_prod
+ON prod.users (department_id, role, created_at DESC, id DESC);
+
+-- ============================================================================
+-- NOTES
+-- ============================================================================
+
+-- IMPORTANT:
+-- 1. No INCLUDE columns: the list returns every UserResponse column, so an index-only scan
+--    is not possible and covering columns would only grow the index
+-- 2. A role-only filter cannot use the composite index's leading column; the table is small
+--    enough that this falls back to the (created_at, id) index
+
+-- ============================================================================
+-- VERIFICATION QUERIES
+-- ============================================================================
+
+-- Verify indexes exist
+-- SELECT schemaname, indexname FROM pg_indexes
+-- WHERE indexname LIKE 'users_created_id_idx_%' OR indexname LIKE 'users_dept_role_created_idx_%';
+
+-- ============================================================================
+-- ROLLBACK SCRIPT (run only if migration fails)
+-- ============================================================================
+
+-- DROP INDEX IF EXISTS test.users_created_id_idx_test;
+-- DROP INDEX IF EXISTS test.users_dept_role_created_idx_test;
+-- DROP INDEX IF EXISTS prod.users_created_id_idx_prod;
+-- DROP INDEX IF EXISTS prod.users_dept_role_created_idx_prod;
@@ -0,0 +1,83 @@
+-- Migration: Verify a user's current password server-side
+-- Date: October 16, 2026
+-- Description: Adds verify_user_password(uid, password), which compares a password with the bcrypt
+--              hash in auth.users.encrypted_password. Replaces the throwaway sign_in_with_password call
+--              (new client + session + JWTs) in UserService._verify_current_password.
+-- Applies to: BOTH test and prod schemas
+
+-- ============================================================================
+-- PHASE 1: EXTENSION
+-- ============================================================================
+
+-- crypt() comes from pgcrypto (installed in the extensions schema on Supabase)
+CREATE EXTENSION IF NOT EXISTS pgcrypto WITH SCHEMA extensions;
+
+-- ============================================================================
+-- PHASE 2: FUNCTIONS
+-- ============================================================================
+
+-- SECURITY DEFINER so the function can read auth.users; execution is restricted to service_role below.
+-- Users without a password (NULL hash) never match.
+CREATE OR REPLACE FUNCTION test.verify_user_password(uid UUID, password TEXT)
+RETURNS BOOLEAN
+LANGUAGE sql
+STABLE
+SECURITY DEFINER
+SET search_path = ''
+AS $$
+  SELECT coalesce(
+    (SELECT encrypted_password = extensions.crypt(password, encrypted_password) FROM auth.users WHERE id = uid),
+    false
+  );
+$$;
+
+CREATE OR REPLACE FUNCTION prod.verify_user_password(uid UUID, password TEXT)
+RETURNS BOOLEAN
+LANGUAGE sql
+STABLE
+SECURITY DEFINER
+SET search_path = ''
+AS $$
+  SELECT coalesce(
+    (SELECT encrypted_password = extensions.crypt(password, encrypted_password) FROM auth.users WHERE id = uid),
+    false
+  );
+$$;
+
+-- ============================================================================
+-- PHASE 3: PERMISSIONS
+-- ============================================================================
+
+-- Never expose a password oracle to anon/authenticated callers
+REVOKE ALL ON FUNCTION test.verify_user_password(UUID, TEXT) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION test.verify_user_password(UUID, TEXT) TO service_role;
+
+REVOKE ALL ON FUNCTION prod.verify_user_password(UUID, TEXT) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION prod.verify_user_password(UUID, TEXT) TO service_role;
+
+-- ============================================================================
+-- NOTES
+-- ============================================================================
+
+-- IMPORTANT:
+-- 1. Only called from PUT /users/password for the authenticated user's own account
+-- 2. Unlike sign-in, this does not go through Supabase Auth rate limiting; the endpoint requires a valid JWT
+
+-- ============================================================================
+-- VERIFICATION QUERIES
+-- ============================================================================
+
+-- Verify functions exist
+-- SELECT routine_schema, routine_name FROM information_schema.routines
+-- WHERE routine_name = 'verify_user_password';
+
+-- Verify anon/authenticated cannot execute (should return false for both)
+-- SELECT has_function_privilege('anon', 'test.verify_user_password(uuid, text)', 'EXECUTE');
+-- SELECT has_function_privilege('authenticated', 'test.verify_user_password(uuid, text)', 'EXECUTE');
+
+-- ============================================================================
+-- ROLLBACK SCRIPT (run only if migration fails)
+-- ============================================================================
+
+-- DROP FUNCTION IF EXISTS test.verify_user_password(UUID, TEXT);
+-- DROP FUNCTION IF EXISTS prod.verify_user_password(UUID, TEXT);
@@ -5,11 +5,20 @@ This module provides configuration, database connections, and shared utilities.
 """
 
 from .config import get_settings, settings
-from .database import get_schema, get_supabase_client
+from .database import (
+    get_http_client,
+    get_schema,
+    get_schema_client,
+    get_supabase_admin_client,
+    get_supabase_client,
+)
 
 __all__ = [
     "get_settings",
     "settings",
     "get_supabase_client",
+    "get_supabase_admin_client",
     "get_schema",
+    "get_schema_client",
+    "get_http_client",
 ]
@@ -43,6 +43,8 @@ class Settings(BaseSettings):
     SERVER_HOST: str = "127.0.0.1"  # Use 127.0.0.1 for local dev, 0.0.0.0 for Docker/production
     SERVER_PORT: int = 8000
     LOG_LEVEL: str = "INFO"  # Logging level: DEBUG, INFO, WARNING, ERROR, CRITICAL
+    # Worker threads for blocking Supabase calls (AnyIO defaults to 40, which caps concurrent requests)
+    THREADPOOL_SIZE: int = 100
 
     # Supabase credentials (single database with test and prod schemas)
     SUPABASE_URL: str
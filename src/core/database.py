@@ -7,11 +7,35 @@ correct PostgreSQL schema (test or prod) based on the environment.
 
 from functools import lru_cache
 
-from supabase import Client, create_client
+import httpx
+from postgrest import SyncPostgrestClient
+from supabase import Client, ClientOptions, create_client
 
 from .config import get_settings
 
 
+@lru_cache
+def get_http_client() -> httpx.Client:
+    """
+    Get the process-wide httpx client shared by all Supabase clients.
+
+    One keep-alive HTTP/2 connection pool serves PostgREST and Auth requests for
+    both the anon and service-role clients; auth headers are sent per request,
+    so sharing the pool is safe.
+    """
+    return httpx.Client(
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=100, max_connections=200),
+        timeout=10.0,
+        follow_redirects=True,
+    )
+
+
+def _client_options() -> ClientOptions:
+    """Options for cached Supabase clients: configured schema + shared connection pool."""
+    return ClientOptions(schema=get_settings().db_schema, httpx_client=get_http_client())
+
+
 @lru_cache
 def get_supabase_client() -> Client:
     """
@@ -27,10 +51,47 @@ def get_supabase_client() -> Client:
     through RLS policies or by prefixing table names with the schema.
     """
     settings = get_settings()
-    client = create_client(settings.SUPABASE_URL, settings.SUPABASE_KEY)
+    client = create_client(settings.SUPABASE_URL, settings.SUPABASE_KEY, options=_client_options())
     return client
 
 
+@lru_cache
+def get_supabase_admin_client() -> Client:
+    """
+    Get a cached Supabase client authenticated with the service role key.
+
+    Bypasses RLS, so only use it behind authenticated endpoints. Built once per
+    process so services don't pay for a new client (and auth headers) per request.
+
+    Usage:
+        from core.database import get_supabase_admin_client
+
+        supabase = get_supabase_admin_client()
+    """
+    settings = get_settings()
+    return create_client(settings.SUPABASE_URL, settings.SUPABASE_SERVICE_ROLE_KEY, options=_client_options())
+
+
+def get_schema_client(client: Client, schema: str) -> SyncPostgrestClient:
+    """
+    Get a PostgREST client for `schema` that reuses `client`'s connection pool.
+
+    Use instead of `client.schema(schema)`, which builds a new PostgREST client with
+    its own httpx connection pool (and TLS handshake) on every call.
+
+    Usage:
+        from core.database import get_schema_client
+
+        result = get_schema_client(supabase, schema).table("users").select("*").execute()
+    """
+    postgrest = client.postgrest
+    if postgrest.headers.get("Accept-Profile") == schema:
+        return postgrest
+    return SyncPostgrestClient(
+        str(postgrest.base_url), schema=schema, headers=dict(postgrest.headers), http_client=postgrest.session
+    )
+
+
 def get_schema() -> str:
     """
     Get the current database schema based on environment.
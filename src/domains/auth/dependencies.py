@@ -4,6 +4,7 @@ Authentication dependencies for FastAPI endpoints.
 This module provides dependency functions for authentication and authorization.
 """
 
+import logging
 from typing import Optional
 from uuid import UUID
 
@@ -15,6 +16,8 @@ from core.database import get_schema
 from .models import UserResponse
 from .repository import UserRepository
 
+logger = logging.getLogger(__name__)
+
 security = HTTPBearer()
 optional_security = HTTPBearer(auto_error=False)
 
@@ -71,7 +74,7 @@ async def get_current_user(
     except HTTPException:
         raise
     except Exception as e:
-        print(f"Authentication error: {e}")
+        logger.warning("Authentication error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials",
@@ -143,7 +146,7 @@ async def get_auth_user_id(
     except HTTPException:
         raise
     except Exception as e:
-        print(f"Authentication error: {e}")
+        logger.warning("Authentication error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials",
@@ -10,6 +10,8 @@ from uuid import UUID
 
 from supabase import Client
 
+from core.database import get_schema_client
+
 from .models import UserResponse
 
 
@@ -37,7 +39,13 @@ class UserRepository:
         Returns:
             UserResponse if found, None otherwise
         """
-        result = self.client.schema(self.schema).table("users").select("*").eq("user_id", str(auth_user_id)).execute()
+        result = (
+            get_schema_client(self.client, self.schema)
+            .table("users")
+            .select("*")
+            .eq("user_id", str(auth_user_id))
+            .execute()
+        )
 
         if not result.data or len(result.data) == 0:
             return None
@@ -54,7 +62,7 @@ class UserRepository:
         Returns:
             UserResponse if found, None otherwise
         """
-        result = self.client.schema(self.schema).table("users").select("*").eq("id", str(user_id)).execute()
+        result = get_schema_client(self.client, self.schema).table("users").select("*").eq("id", str(user_id)).execute()
 
         if not result.data or len(result.data) == 0:
             return None
@@ -71,7 +79,9 @@ class UserRepository:
         Returns:
             UserResponse if found, None otherwise
         """
-        result = self.client.schema(self.schema).table("users").select("*").eq("email", email.lower()).execute()
+        result = (
+            get_schema_client(self.client, self.schema).table("users").select("*").eq("email", email.lower()).execute()
+        )
 
         if not result.data or len(result.data) == 0:
             return None
@@ -14,7 +14,8 @@ from supabase import Client, create_client
 from supabase_auth.errors import AuthApiError, AuthInvalidCredentialsError
 
 from core.config import get_settings
-from core.database import get_schema, get_supabase_client
+from core.database import get_schema, get_schema_client, get_supabase_client
+from domains.users.cache import cache_user
 
 from .models import (
     CompleteOnboardingRequest,
@@ -148,7 +149,11 @@ class AuthService:
             # Update user in database
             result = cast(
                 APIResponse,
-                self.supabase.schema(self.schema).table("users").update(update_data).eq("id", str(user_id)).execute(),
+                get_schema_client(self.supabase, self.schema)
+                .table("users")
+                .update(update_data)
+                .eq("id", str(user_id))
+                .execute(),
             )
 
             if not result.data or len(result.data) == 0:
@@ -157,7 +162,11 @@ class AuthService:
                     detail="User not found",
                 )
 
-            return UserResponse(**cast(dict[str, Any], result.data[0]))
+            user = UserResponse(**cast(dict[str, Any], result.data[0]))
+
+            # Keep the users domain's read cache in step with this write
+            cache_user(user)
+            return user
 
         except HTTPException:
             raise
@@ -291,7 +300,7 @@ class AuthService:
             logger.info("Creating user record for user %s", auth_user_id)
 
             # Use admin client to bypass RLS policies
-            result = admin_client.schema(self.schema).table("users").insert(user_data).execute()
+            result = get_schema_client(admin_client, self.schema).table("users").insert(user_data).execute()
 
             if not result.data or len(result.data) == 0:
                 raise HTTPException(
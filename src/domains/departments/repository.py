@@ -10,6 +10,8 @@ from uuid import UUID
 
 from supabase import Client
 
+from core.database import get_schema_client
+
 from .models import DepartmentResponse
 
 
@@ -38,7 +40,7 @@ class DepartmentRepository:
             List of DepartmentResponse objects
         """
 
-        query = self.client.schema(self.schema).table("departments").select("*").order("name")
+        query = get_schema_client(self.client, self.schema).table("departments").select("*").order("name")
 
         if year is not None:
             query = query.eq("year", year)
@@ -60,7 +62,13 @@ class DepartmentRepository:
         Returns:
             DepartmentResponse if found, None otherwise
         """
-        result = self.client.schema(self.schema).table("departments").select("*").eq("id", str(department_id)).execute()
+        result = (
+            get_schema_client(self.client, self.schema)
+            .table("departments")
+            .select("*")
+            .eq("id", str(department_id))
+            .execute()
+        )
 
         if not result.data or len(result.data) == 0:
             return None
@@ -74,7 +82,7 @@ class DepartmentRepository:
         Returns:
             List of years (integers) in descending order
         """
-        result = self.client.schema(self.schema).table("departments").select("year").execute()
+        result = get_schema_client(self.client, self.schema).table("departments").select("year").execute()
 
         if not result.data:
             return []
@@ -4,6 +4,7 @@ Department service - Business logic for department operations.
 This module handles business logic for department management.
 """
 
+import logging
 from typing import Optional
 from uuid import UUID
 
@@ -16,6 +17,8 @@ from core.database import get_schema
 from .models import DepartmentListResponse, DepartmentResponse, YearsResponse
 from .repository import DepartmentRepository
 
+logger = logging.getLogger(__name__)
+
 
 def get_current_academic_year() -> int:
     """
@@ -98,7 +101,7 @@ class DepartmentService:
         except HTTPException:
             raise
         except Exception as e:
-            print(f"Error fetching departments: {e}")
+            logger.exception("Error fetching departments")
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Failed to fetch departments: {str(e)}",
@@ -131,7 +134,7 @@ class DepartmentService:
         except HTTPException:
             raise
         except Exception as e:
-            print(f"Error fetching department: {e}")
+            logger.exception("Error fetching department %s", department_id)
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Failed to fetch department: {str(e)}",
@@ -156,7 +159,7 @@ class DepartmentService:
         except HTTPException:
             raise
         except Exception as e:
-            print(f"Error fetching available years: {e}")
+            logger.exception("Error fetching available years")
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Failed to fetch available years: {str(e)}",
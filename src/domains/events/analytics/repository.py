@@ -9,6 +9,8 @@ from uuid import UUID
 
 from supabase import Client
 
+from core.database import get_schema_client
+
 from .models import AnalyticsResponse, StatusBreakdown, TimelinePoint
 
 
@@ -21,7 +23,9 @@ class AnalyticsRepository:
 
     def get_status_counts(self, event_id: UUID) -> StatusBreakdown:
         result = (
-            self.client.schema(self.schema).rpc("get_event_registration_stats", {"p_event_id": str(event_id)}).execute()
+            get_schema_client(self.client, self.schema)
+            .rpc("get_event_registration_stats", {"p_event_id": str(event_id)})
+            .execute()
         )
         raw_data = result.data or [{}]
         data = cast(dict[str, Any], raw_data[0] if isinstance(raw_data, list) else raw_data)
@@ -36,7 +40,7 @@ class AnalyticsRepository:
 
     def get_timeline(self, event_id: UUID) -> list[TimelinePoint]:
         result = (
-            self.client.schema(self.schema)
+            get_schema_client(self.client, self.schema)
             .table("event_registrations")
             .select("submitted_at")
             .eq("event_id", str(event_id))
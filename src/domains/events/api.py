@@ -4,6 +4,7 @@ Event API endpoints.
 Provides REST API endpoints for event management.
 """
 
+from functools import lru_cache
 from typing import Optional
 from uuid import UUID
 
@@ -26,8 +27,9 @@ from .service import EventService
 router = APIRouter()
 
 
+@lru_cache
 def get_event_service() -> EventService:
-    """Dependency to get EventService instance."""
+    """Dependency to get EventService instance (built once; the service is stateless)."""
     return EventService()
 
 
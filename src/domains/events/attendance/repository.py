@@ -8,6 +8,7 @@ from uuid import UUID
 
 from supabase import Client
 
+from core.database import get_schema_client
 from domains.events.registrations.models import RegistrationResponse
 
 
@@ -22,7 +23,7 @@ class AttendanceRepository:
         self, registration_id: UUID, checked_in_by: UUID, checked_in_at: datetime
     ) -> Optional[RegistrationResponse]:
         result = (
-            self.client.schema(self.schema)
+            get_schema_client(self.client, self.schema)
             .table("event_registrations")
             .update(
                 {
@@ -48,7 +49,7 @@ class AttendanceRepository:
             return []
 
         result = (
-            self.client.schema(self.schema)
+            get_schema_client(self.client, self.schema)
             .table("event_registrations")
             .update(
                 {
@@ -69,7 +70,7 @@ class AttendanceRepository:
     def get_check_in_stats(self, event_id: UUID) -> dict:
         # Simple aggregation using Supabase query; for heavy use, add an RPC.
         result = (
-            self.client.schema(self.schema)
+            get_schema_client(self.client, self.schema)
             .table("event_registrations")
             .select("status, checked_in")
             .eq("event_id", str(event_id))
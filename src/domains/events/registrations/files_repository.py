@@ -10,6 +10,8 @@ from postgrest import ReturnMethod
 from postgrest.types import JSON
 from supabase import Client
 
+from core.database import get_schema_client
+
 from .models import FileMeta
 
 
@@ -40,7 +42,7 @@ class RegistrationFilesRepository:
             "upload_session_id": upload_session_id,
         }
         result = (
-            self.client.schema(self.schema)
+            get_schema_client(self.client, self.schema)
             .table("registration_files")
             .insert(cast(JSON, data), returning=ReturnMethod.representation)
             .execute()
@@ -51,7 +53,7 @@ class RegistrationFilesRepository:
 
     def get_files_by_registration(self, registration_id: UUID) -> List[FileMeta]:
         result = (
-            self.client.schema(self.schema)
+            get_schema_client(self.client, self.schema)
             .table("registration_files")
             .select("*")
             .eq("registration_id", str(registration_id))
@@ -61,7 +63,7 @@ class RegistrationFilesRepository:
 
     def get_files_by_upload_session(self, upload_session_id: str) -> List[FileMeta]:
         result = (
-            self.client.schema(self.schema)
+            get_schema_client(self.client, self.schema)
             .table("registration_files")
             .select("*")
             .eq("upload_session_id", upload_session_id)
@@ -71,19 +73,29 @@ class RegistrationFilesRepository:
 
     def get_file_by_id(self, file_id: UUID) -> Optional[FileMeta]:
         result = (
-            self.client.schema(self.schema).table("registration_files").select("*").eq("id", str(file_id)).execute()
+            get_schema_client(self.client, self.schema)
+            .table("registration_files")
+            .select("*")
+            .eq("id", str(file_id))
+            .execute()
         )
         if not result.data:
             return None
         return FileMeta.model_validate(result.data[0])
 
     def delete_file_by_id(self, file_id: UUID) -> bool:
-        result = self.client.schema(self.schema).table("registration_files").delete().eq("id", str(file_id)).execute()
+        result = (
+            get_schema_client(self.client, self.schema)
+            .table("registration_files")
+            .delete()
+            .eq("id", str(file_id))
+            .execute()
+        )
         return bool(result.data)
 
     def get_file_for_field(self, upload_session_id: str, field_name: str, event_id: UUID) -> List[FileMeta]:
         result = (
-            self.client.schema(self.schema)
+            get_schema_client(self.client, self.schema)
             .table("registration_files")
             .select("*")
             .eq("upload_session_id", upload_session_id)
@@ -103,7 +115,7 @@ class RegistrationFilesRepository:
             "scheduled_deletion_date": deletion_date.isoformat() if deletion_date else None,
         }
         result = (
-            self.client.schema(self.schema)
+            get_schema_client(self.client, self.schema)
             .table("registration_files")
             .update(update_data, returning=ReturnMethod.representation)
             .eq("upload_session_id", upload_session_id)
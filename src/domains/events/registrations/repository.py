@@ -10,6 +10,8 @@ from postgrest import CountMethod, ReturnMethod
 from postgrest.types import JSON
 from supabase import Client
 
+from core.database import get_schema_client
+
 from .models import RegistrationResponse, RegistrationStatus
 
 
@@ -33,7 +35,7 @@ class RegistrationsRepository:
         }
 
         result = (
-            self.client.schema(self.schema)
+            get_schema_client(self.client, self.schema)
             .table("event_registrations")
             .insert(cast(JSON, insert_data), returning=ReturnMethod.representation)
             .execute()
@@ -46,7 +48,7 @@ class RegistrationsRepository:
 
     def get_registration_by_id(self, registration_id: UUID) -> Optional[RegistrationResponse]:
         result = (
-            self.client.schema(self.schema)
+            get_schema_client(self.client, self.schema)
             .table("event_registrations")
             .select("*")
             .eq("id", str(registration_id))
@@ -66,7 +68,7 @@ class RegistrationsRepository:
     ) -> Tuple[List[RegistrationResponse], int]:
         offset = (page - 1) * limit
         query = (
-            self.client.schema(self.schema)
+            get_schema_client(self.client, self.schema)
             .table("event_registrations")
             .select("*", count=CountMethod.exact)
             .eq("event_id", str(event_id))
@@ -92,7 +94,7 @@ class RegistrationsRepository:
         Return the total number of registrations for an event.
         """
         result = (
-            self.client.schema(self.schema)
+            get_schema_client(self.client, self.schema)
             .table("event_registrations")
             .select("id", count=CountMethod.exact)
             .eq("event_id", str(event_id))
@@ -114,7 +116,7 @@ class RegistrationsRepository:
         }
 
         result = (
-            self.client.schema(self.schema)
+            get_schema_client(self.client, self.schema)
             .table("event_registrations")
             .update(update_data, returning=ReturnMethod.representation)
             .eq("id", str(registration_id))
@@ -131,7 +133,7 @@ class RegistrationsRepository:
         Only returns registrations with status in ['accepted', 'confirmed', 'not_attending'].
         """
         result = (
-            self.client.schema(self.schema)
+            get_schema_client(self.client, self.schema)
             .table("event_registrations")
             .select("*")
             .eq("id", str(registration_id))
@@ -148,7 +150,7 @@ class RegistrationsRepository:
         Only updates if current status is 'accepted'.
         """
         result = (
-            self.client.schema(self.schema)
+            get_schema_client(self.client, self.schema)
             .table("event_registrations")
             .update(
                 {
@@ -172,7 +174,7 @@ class RegistrationsRepository:
         This is a terminal status - cannot be changed after.
         """
         result = (
-            self.client.schema(self.schema)
+            get_schema_client(self.client, self.schema)
             .table("event_registrations")
             .update(
                 {
@@ -4,8 +4,8 @@ Business logic for event registrations.
 
 import re
 from collections import defaultdict
-from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Tuple
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from uuid import UUID
 
 from fastapi import HTTPException, status
@@ -16,6 +16,7 @@ from core.database import get_schema
 
 from ..models import EventResponse, RegistrationFormSchema
 from ..repository import EventRepository
+from ..service import invalidate_events_list_cache
 from .files_repository import RegistrationFilesRepository
 from .models import (
     FileMeta,
@@ -35,6 +36,13 @@ NOT_ELIGIBLE_FOR_CONFIRMATION = "Registration is not eligible for confirmation"
 EVENT_PASSED = "Cannot confirm attendance - event has already passed"
 RSVP_CUTOFF_PASSED = "Cannot change RSVP - cutoff is 24 hours before event"
 
+# RSVP changes close this long before the event starts
+RSVP_CUTOFF = timedelta(hours=24)
+
+
+def _utc_now() -> datetime:
+    return datetime.now(timezone.utc)
+
 
 class RegistrationService:
     """Service layer for handling registration lifecycle."""
@@ -42,7 +50,12 @@ class RegistrationService:
     MAX_FILE_SIZE = 2_097_152  # 2MB
     ALLOWED_TYPES = {"application/pdf"}
 
-    def __init__(self):
+    # Source of "now" for deadline, review and RSVP checks; tests inject a fixed clock
+    _clock: Callable[[], datetime] = staticmethod(_utc_now)
+
+    def __init__(self, clock: Optional[Callable[[], datetime]] = None):
+        if clock is not None:
+            self._clock = clock
         settings = get_settings()
         self.schema = get_schema()
         self.supabase: Client = create_client(settings.SUPABASE_URL, settings.SUPABASE_SERVICE_ROLE_KEY)
@@ -134,6 +147,16 @@ class RegistrationService:
                     }
                 )
 
+    # Form field type -> validator, built once with the class; called as validator(self, field, value, errors)
+    _FIELD_VALIDATORS: Dict[str, Callable[["RegistrationService", dict, Any, List[dict]], None]] = {
+        "text": _validate_text,
+        "textarea": _validate_text,
+        "select": _validate_choice,
+        "radio": _validate_choice,
+        "checkbox": _validate_checkboxes,
+        "file": _validate_files,
+    }
+
     def _is_missing_required(self, field_type: str, required: bool, value: Any, files: List[FileMeta]) -> bool:
         if not required:
             return False
@@ -151,15 +174,6 @@ class RegistrationService:
         errors: List[dict] = []
         fields = form_schema.get("fields", []) if form_schema else []
 
-        validators = {
-            "text": self._validate_text,
-            "textarea": self._validate_text,
-            "select": self._validate_choice,
-            "radio": self._validate_choice,
-            "checkbox": self._validate_checkboxes,
-            "file": self._validate_files,
-        }
-
         for field in fields:
             field_id = field.get("id")
             field_type = field.get("type")
@@ -174,12 +188,9 @@ class RegistrationService:
             if value is None and not files:
                 continue
 
-            validator = validators.get(field_type)
+            validator = self._FIELD_VALIDATORS.get(field_type)
             if validator:
-                if field_type == "file":
-                    validator(field, files, errors)
-                else:
-                    validator(field, value, errors)  # type: ignore[arg-type]
+                validator(self, field, files if field_type == "file" else value, errors)
 
         return errors
 
@@ -203,7 +214,7 @@ class RegistrationService:
     def _enforce_deadline(self, event):
         if not event.registration_deadline:
             return
-        now = datetime.now(timezone.utc)
+        now = self._clock()
         deadline = (
             event.registration_deadline
             if event.registration_deadline.tzinfo
@@ -228,6 +239,8 @@ class RegistrationService:
         if registration_count >= event.max_capacity:
             updated_schema = form_schema.model_copy(update={"auto_accept": False})
             self.events_repo.update_form_schema(event.id, updated_schema)
+            # Listed events embed the form schema; don't keep serving auto_accept: true
+            invalidate_events_list_cache()
 
     def submit_registration(
         self, event_slug: str, form_data: Dict[str, Any], upload_session_id: str
@@ -836,7 +849,7 @@ class RegistrationService:
             registration_id=registration_id,
             status="accepted",
             reviewer_id=reviewer_id,
-            reviewed_at=datetime.now(timezone.utc),
+            reviewed_at=self._clock(),
         )
         if not updated:
             raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to update status")
@@ -859,7 +872,7 @@ class RegistrationService:
             registration_id=registration_id,
             status="rejected",
             reviewer_id=reviewer_id,
-            reviewed_at=datetime.now(timezone.utc),
+            reviewed_at=self._clock(),
         )
         if not updated:
             raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to update status")
@@ -869,21 +882,22 @@ class RegistrationService:
 
         return updated
 
-    def _has_event_passed(self, event_date: datetime) -> bool:
+    def _has_event_passed(self, event_date: datetime, now: Optional[datetime] = None) -> bool:
         """
         Check if the event date has passed.
 
         Args:
             event_date: The event's date_time
+            now: Current time, if the caller already took it (defaults to self._clock())
 
         Returns:
             True if event has passed, False otherwise
         """
-        now = datetime.now(timezone.utc)
+        now = now or self._clock()
         event_dt = event_date if event_date.tzinfo else event_date.replace(tzinfo=timezone.utc)
         return now > event_dt
 
-    def _is_within_rsvp_cutoff(self, event_date: datetime) -> bool:
+    def _is_within_rsvp_cutoff(self, event_date: datetime, now: Optional[datetime] = None) -> bool:
         """
         Check if current time is within the 24-hour RSVP cutoff period.
 
@@ -892,16 +906,14 @@ class RegistrationService:
 
         Args:
             event_date: The event's date_time
+            now: Current time, if the caller already took it (defaults to self._clock())
 
         Returns:
             True if within 24-hour cutoff (changes NOT allowed), False otherwise
         """
-        from datetime import timedelta
-
-        now = datetime.now(timezone.utc)
+        now = now or self._clock()
         event_dt = event_date if event_date.tzinfo else event_date.replace(tzinfo=timezone.utc)
-        cutoff_time = event_dt - timedelta(hours=24)
-        return now >= cutoff_time
+        return event_dt - now <= RSVP_CUTOFF
 
     def rsvp_details(self, registration_id: UUID) -> tuple:
         """
@@ -933,9 +945,10 @@ class RegistrationService:
                 detail=EVENT_NOT_FOUND,
             )
 
-        # Calculate metadata for UI
-        event_has_passed = self._has_event_passed(event.date_time)
-        within_rsvp_cutoff = self._is_within_rsvp_cutoff(event.date_time)
+        # Calculate metadata for UI (one clock reading for both checks)
+        now = self._clock()
+        event_has_passed = self._has_event_passed(event.date_time, now)
+        within_rsvp_cutoff = self._is_within_rsvp_cutoff(event.date_time, now)
         current_status = registration.status
 
         # Terminal statuses that cannot be changed
@@ -996,15 +1009,16 @@ class RegistrationService:
                 detail=EVENT_NOT_FOUND,
             )
 
-        # Check if event has passed
-        if self._has_event_passed(event.date_time):
+        # Check if event has passed (one clock reading for all time checks below)
+        now = self._clock()
+        if self._has_event_passed(event.date_time, now):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=EVENT_PASSED,
             )
 
         # Check if within 24-hour RSVP cutoff
-        if self._is_within_rsvp_cutoff(event.date_time):
+        if self._is_within_rsvp_cutoff(event.date_time, now):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=RSVP_CUTOFF_PASSED,
@@ -1021,7 +1035,7 @@ class RegistrationService:
                 detail=NOT_ELIGIBLE_FOR_CONFIRMATION,
             )
 
-        updated = self.reg_repo.confirm_registration(registration_id, confirmed_at=datetime.now(timezone.utc))
+        updated = self.reg_repo.confirm_registration(registration_id, confirmed_at=now)
         if not updated:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -1068,15 +1082,16 @@ class RegistrationService:
                 detail=EVENT_NOT_FOUND,
             )
 
-        # Check if event has passed
-        if self._has_event_passed(event.date_time):
+        # Check if event has passed (one clock reading for all time checks below)
+        now = self._clock()
+        if self._has_event_passed(event.date_time, now):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Cannot decline attendance - event has already passed",
             )
 
         # Check if within 24-hour RSVP cutoff
-        if self._is_within_rsvp_cutoff(event.date_time):
+        if self._is_within_rsvp_cutoff(event.date_time, now):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=RSVP_CUTOFF_PASSED,
@@ -1093,7 +1108,7 @@ class RegistrationService:
                 detail="Registration is not eligible for declining",
             )
 
-        updated = self.reg_repo.set_not_attending(registration_id, declined_at=datetime.now(timezone.utc))
+        updated = self.reg_repo.set_not_attending(registration_id, declined_at=now)
         if not updated:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
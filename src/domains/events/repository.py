@@ -10,6 +10,8 @@ from uuid import UUID
 from postgrest import CountMethod
 from supabase import Client
 
+from core.database import get_schema_client
+
 from .models import (
     EventCreate,
     EventResponse,
@@ -51,7 +53,7 @@ class EventRepository:
             Tuple of (list of events, total count)
         """
         # Build query
-        query = self.client.schema(self.schema).table("events").select("*", count=CountMethod.exact)
+        query = get_schema_client(self.client, self.schema).table("events").select("*", count=CountMethod.exact)
 
         # Apply filters
         if status is not None:
@@ -88,7 +90,9 @@ class EventRepository:
         Returns:
             EventResponse if found, None otherwise
         """
-        result = self.client.schema(self.schema).table("events").select("*").eq("id", str(event_id)).execute()
+        result = (
+            get_schema_client(self.client, self.schema).table("events").select("*").eq("id", str(event_id)).execute()
+        )
 
         if not result.data or len(result.data) == 0:
             return None
@@ -105,7 +109,7 @@ class EventRepository:
         Returns:
             EventResponse if found, None otherwise
         """
-        result = self.client.schema(self.schema).table("events").select("*").eq("slug", slug).execute()
+        result = get_schema_client(self.client, self.schema).table("events").select("*").eq("slug", slug).execute()
 
         if not result.data:
             return None
@@ -136,7 +140,7 @@ class EventRepository:
         if created_by is not None:
             insert_data["created_by"] = str(created_by)
 
-        result = self.client.schema(self.schema).table("events").insert(insert_data).execute()
+        result = get_schema_client(self.client, self.schema).table("events").insert(insert_data).execute()
 
         if not result.data or len(result.data) == 0:
             raise ValueError("Failed to create event")
@@ -162,7 +166,13 @@ class EventRepository:
             # No fields to update
             return self.get_by_id(event_id)
 
-        result = self.client.schema(self.schema).table("events").update(update_data).eq("id", str(event_id)).execute()
+        result = (
+            get_schema_client(self.client, self.schema)
+            .table("events")
+            .update(update_data)
+            .eq("id", str(event_id))
+            .execute()
+        )
 
         if not result.data or len(result.data) == 0:
             return None
@@ -181,7 +191,13 @@ class EventRepository:
             EventResponse if updated, None otherwise
         """
         update_data = {"registration_form_schema": schema.model_dump(mode="json")}
-        result = self.client.schema(self.schema).table("events").update(update_data).eq("id", str(event_id)).execute()
+        result = (
+            get_schema_client(self.client, self.schema)
+            .table("events")
+            .update(update_data)
+            .eq("id", str(event_id))
+            .execute()
+        )
         if not result.data:
             return None
         return EventResponse(**cast(dict, result.data[0]))
@@ -194,10 +210,9 @@ class EventRepository:
             event_id: Event UUID
 
         Returns:
-            True if deleted, False otherwise
+            True if deleted, False if not found
         """
-        result = self.client.schema(self.schema).table("events").delete().eq("id", str(event_id)).execute()
+        # DELETE ... RETURNING: deleted rows come back in the same round trip
+        result = get_schema_client(self.client, self.schema).table("events").delete().eq("id", str(event_id)).execute()
 
-        # Supabase delete returns empty data array on success
-        # Check if any rows were affected by checking the result
-        return result is not None
+        return bool(result.data)
@@ -6,14 +6,18 @@ This module handles business logic for event management.
 
 import logging
 import re
+import string
+import threading
+from functools import lru_cache
 from typing import Optional
 from uuid import UUID
 
+from cachetools import TTLCache
 from fastapi import HTTPException, status
-from supabase import Client, create_client
+from supabase import Client
 
 from core.config import get_settings
-from core.database import get_schema
+from core.database import get_schema, get_supabase_admin_client
 from utils.google_drive_service import generate_direct_link
 
 from .models import (
@@ -28,26 +32,35 @@ from .repository import EventRepository
 # Set up logger for this module
 logger = logging.getLogger(__name__)
 
+# ASCII slug table: uppercase -> lowercase, every other non-alphanumeric -> "-"
+_SLUG_TABLE = str.maketrans(
+    {chr(c): "-" for c in range(128) if not chr(c).isalnum()} | {c: c.lower() for c in string.ascii_uppercase}
+)
+_NON_SLUG_RE = re.compile(r"[^a-z0-9]+")
+
+# Short-lived cache of event list responses keyed by (status, limit, offset).
+# Cleared on every event write made through EventService or RegistrationService;
+# other processes may serve a stale list for at most the TTL.
+_events_list_cache: TTLCache[tuple, EventListResponse] = TTLCache(maxsize=128, ttl=30)
+_events_list_cache_lock = threading.Lock()
+
+
+def invalidate_events_list_cache() -> None:
+    """Drop all cached event lists after a create/update/delete or a form schema change."""
+    with _events_list_cache_lock:
+        _events_list_cache.clear()
+
 
 class EventService:
     """Service class for event management operations."""
 
-    def __init__(self):
+    def __init__(self, supabase: Optional[Client] = None):
         self.settings = get_settings()
         self.schema = get_schema()
         # Use admin client to bypass RLS (endpoints are protected by authentication)
-        self.supabase = self._get_admin_client()
+        self.supabase = supabase or get_supabase_admin_client()
         self.repository = EventRepository(self.supabase, self.schema)
 
-    def _get_admin_client(self) -> Client:
-        """
-        Get Supabase client with service role key for admin operations.
-
-        Returns:
-            Client: Supabase client with admin privileges
-        """
-        return create_client(self.settings.SUPABASE_URL, self.settings.SUPABASE_SERVICE_ROLE_KEY)
-
     def _convert_google_drive_url_if_needed(self, url: Optional[str]) -> Optional[str]:
         """
         Convert Google Drive URL to direct download link if needed.
@@ -87,25 +100,16 @@ class EventService:
     # ------------------------------------------------------------------ #
     @staticmethod
     def _slugify(text: str) -> str:
-        slug = re.sub(r"[^a-zA-Z0-9]+", "-", text.lower())
-        slug = re.sub(r"-+", "-", slug).strip("-")
-        return slug
-
-    def _build_slug(self, title: str, event_year: int) -> str:
-        title_with_year = title
-        if str(event_year) not in title:
-            title_with_year = f"{title} {event_year}"
-        return self._slugify(title_with_year)
-
-    def _ensure_unique_slug(self, base_slug: str, current_id: Optional[UUID] = None) -> str:
-        slug = base_slug
-        counter = 1
-        existing = self.repository.get_by_slug(slug)
-        while existing and (current_id is None or existing.id != current_id):
-            counter += 1
-            slug = f"{base_slug}-{counter}"
-            existing = self.repository.get_by_slug(slug)
-        return slug
+        if text.isascii():
+            return "-".join(part for part in text.translate(_SLUG_TABLE).split("-") if part)
+        # Non-ASCII titles (accents, etc.) fall back to the regex path
+        return _NON_SLUG_RE.sub("-", text.lower()).strip("-")
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _build_slug(title: str, event_year: int) -> str:
+        year = f"{event_year}"
+        return EventService._slugify(title if year in title else f"{title} {year}")
 
     # ------------------------------------------------------------------ #
     # Event operations
@@ -127,8 +131,19 @@ class EventService:
         Returns:
             EventListResponse: List of events
         """
+        cache_key = (status, limit, offset)
+        with _events_list_cache_lock:
+            cached = _events_list_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         events, _ = self.repository.get_all(status=status, limit=limit, offset=offset)
-        return EventListResponse(events=events)
+        # Events are already validated EventResponse models; skip re-validating the wrapper
+        response = EventListResponse.model_construct(events=events)
+
+        with _events_list_cache_lock:
+            _events_list_cache[cache_key] = response
+        return response
 
     def get_event_by_id(self, event_id: UUID) -> EventResponse:
         """
@@ -159,12 +174,13 @@ class EventService:
             if event_data.image_url:
                 event_data.image_url = self._convert_google_drive_url_if_needed(event_data.image_url)
 
+            # Collisions are resolved by the events_slug_tg trigger (suffix derived from the row id)
             if not event_data.slug:
-                year = event_data.date_time.year
-                base_slug = self._build_slug(event_data.title, year)
-                event_data.slug = self._ensure_unique_slug(base_slug)
+                event_data.slug = self._build_slug(event_data.title, event_data.date_time.year)
 
-            return self.repository.create(event_data, created_by=created_by)
+            event = self.repository.create(event_data, created_by=created_by)
+            invalidate_events_list_cache()
+            return event
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -188,17 +204,13 @@ class EventService:
         new_title = event_data.title or current.title
         new_date = event_data.date_time or current.date_time
 
-        desired_slug = event_data.slug
-        if not desired_slug:
-            base_slug = self._build_slug(new_title, new_date.year)
-            desired_slug = base_slug
-
-        if desired_slug != current.slug:
-            desired_slug = self._ensure_unique_slug(desired_slug, current_id=current.id)
-        else:
-            desired_slug = current.slug
-
-        event_data.slug = desired_slug
+        # Derive a slug only when one is given or the title/event year actually changes; any
+        # other edit keeps the current slug (which may carry a disambiguating suffix) so public
+        # links don't move. Only send it when it differs; the events_slug_tg trigger
+        # disambiguates collisions.
+        if event_data.slug or new_title != current.title or new_date.year != current.date_time.year:
+            desired_slug = event_data.slug or self._build_slug(new_title, new_date.year)
+            event_data.slug = desired_slug if desired_slug != current.slug else None
 
         event = self.repository.update(event_id, event_data)
         if not event:
@@ -206,6 +218,7 @@ class EventService:
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Event with id {event_id} not found",
             )
+        invalidate_events_list_cache()
         return event
 
     def delete_event(self, event_id: UUID) -> None:
@@ -216,20 +229,12 @@ class EventService:
             event_id: Event UUID
 
         Raises:
-            HTTPException: If event not found or deletion fails
+            HTTPException: If event not found
         """
-        # Check if event exists
-        event = self.repository.get_by_id(event_id)
-        if not event:
+        # Delete returns the removed row, so no separate existence check is needed
+        if not self.repository.delete(event_id):
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Event with id {event_id} not found",
             )
-
-        # Delete the event
-        success = self.repository.delete(event_id)
-        if not success:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Failed to delete event with id {event_id}",
-            )
+        invalidate_events_list_cache()
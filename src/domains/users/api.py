@@ -4,13 +4,17 @@ User API endpoints.
 This module defines the FastAPI router for user-related endpoints.
 """
 
+from functools import lru_cache
 from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, BackgroundTasks, Depends, Query, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
 
 from domains.auth.dependencies import get_current_user
 from domains.auth.models import UserResponse
+from utils.http_cache import compute_etag, is_not_modified, not_modified_response, set_cache_headers
+from utils.rate_limit import rate_limit
 
 from .models import (
     ChangePasswordRequest,
@@ -22,9 +26,17 @@ from .models import (
 from .service import UserService
 
 # Create router
+# UserService uses the synchronous Supabase client, so handlers run its calls in the
+# threadpool instead of blocking the event loop for the duration of each HTTP round trip.
 router = APIRouter()
 
 
+@lru_cache
+def get_user_service() -> UserService:
+    """Dependency to get a shared UserService instance."""
+    return UserService()
+
+
 # ============================================================================
 # User Endpoints
 # ============================================================================
@@ -38,13 +50,17 @@ router = APIRouter()
     description="Get list of users with optional filtering and pagination (requires authentication)",
 )
 async def list_users(
+    http_request: Request,
+    response: Response,
     department_id: Optional[UUID] = Query(None, description="Filter by department ID"),
     role: Optional[str] = Query(None, description="Filter by role (co_president, vp, director)"),
     year: Optional[int] = Query(None, description="Filter by year"),
     search: Optional[str] = Query(None, description="Search in name, email, or role"),
     page: Optional[int] = Query(None, ge=1, description="Page number (1-indexed)"),
     page_size: Optional[int] = Query(None, ge=1, le=100, description="Items per page (max 100)"),
+    cursor: Optional[str] = Query(None, description="nextCursor from the previous page (keyset pagination)"),
     current_user: UserResponse = Depends(get_current_user),
+    service: UserService = Depends(get_user_service),
 ):
     """
     Get list of users with optional filtering and pagination.
@@ -56,9 +72,12 @@ async def list_users(
     - `department_id`: Filter by specific department UUID
     - `role`: Filter by role (co_president, vp, director)
     - `year`: Filter by year (requires year field in users table)
-    - `search`: Search query for first_name, last_name, email, or display_role
+    - `search`: Search terms; each must appear in first_name, last_name, email, or display_role
     - `page`: Page number for pagination (default: no pagination)
     - `page_size`: Number of items per page (default: no pagination, max: 100)
+    - `cursor`: `nextCursor` from the previous response; fetches the page after it without
+      an OFFSET scan (requires `page_size`, cannot be combined with `page`; `total` then counts
+      users from the cursor onward)
 
     **Examples:**
     - `GET /users` → All users
@@ -66,19 +85,32 @@ async def list_users(
     - `GET /users?search=john` → Users matching "john"
     - `GET /users?page=1&page_size=10` → First 10 users
     - `GET /users?department_id=xyz&page=2&page_size=10` → Second page of department xyz
+    - `GET /users?page_size=10&cursor=abc` → The 10 users after cursor abc
 
     **Returns:**
     - List of users with total count and pagination metadata
+    - `ETag` header; send it back as `If-None-Match` to get an empty 304 if the page is unchanged.
+      The ETag is computed after the full query, so revalidation saves response bandwidth only,
+      not the database round trip
+
+    **Errors:**
+    - 400: Invalid `cursor`, or `cursor` sent with `page` or without `page_size`
     """
-    service = UserService()
-    return service.get_users(
+    result = await run_in_threadpool(
+        service.get_users,
         department_id=department_id,
         role=role,
         year=year,
         search=search,
         page=page,
         page_size=page_size,
+        cursor=cursor,
     )
+    etag = compute_etag(result)
+    if is_not_modified(http_request, etag):
+        return not_modified_response(etag)
+    set_cache_headers(response, etag)
+    return result
 
 
 @router.put(
@@ -91,6 +123,10 @@ async def list_users(
 async def change_password(
     request: ChangePasswordRequest,
     current_user: UserResponse = Depends(get_current_user),
+    # The current password is checked with a direct hash comparison, which Supabase Auth
+    # doesn't throttle; cap attempts so a stolen token can't be used to guess it
+    _rl: None = Depends(rate_limit("change_password", limit=5, window_seconds=60)),
+    service: UserService = Depends(get_user_service),
 ):
     """
     Change the authenticated user's password.
@@ -112,9 +148,9 @@ async def change_password(
     **Errors:**
     - 400: New password does not meet requirements or passwords don't match
     - 401: Current password is incorrect
+    - 429: Too many password change attempts
     """
-    service = UserService()
-    return service.change_password(request, current_user)
+    return await run_in_threadpool(service.change_password, request, current_user)
 
 
 # ============================================================================
@@ -169,7 +205,10 @@ async def users_status():
 )
 async def get_user(
     user_id: UUID,
+    http_request: Request,
+    response: Response,
     current_user: UserResponse = Depends(get_current_user),
+    service: UserService = Depends(get_user_service),
 ):
     """
     Get user by ID.
@@ -181,13 +220,23 @@ async def get_user(
     - `user_id`: User UUID
 
     **Returns:**
-    - User details
+    - User details. Served from a per-worker cache, so a change made through another
+      worker or instance (including role/department) can take up to 30 seconds to show
+    - `ETag` header; send it back as `If-None-Match` to get an empty 304 if the user is unchanged.
+      Revalidation is always checked against a fresh database read (never the cache), so it
+      saves response bandwidth only, not the database round trip
 
     **Errors:**
     - 404: User not found
     """
-    service = UserService()
-    return service.get_user_by_id(user_id)
+    # A 304 must not confirm a copy that only this worker's cache still holds
+    revalidating = "if-none-match" in http_request.headers
+    user = await run_in_threadpool(service.get_user_by_id, user_id, fresh=revalidating)
+    etag = compute_etag(user)
+    if is_not_modified(http_request, etag):
+        return not_modified_response(etag)
+    set_cache_headers(response, etag)
+    return user
 
 
 @router.put(
@@ -200,7 +249,9 @@ async def get_user(
 async def update_user(
     user_id: UUID,
     request: UpdateUserRequest,
+    background_tasks: BackgroundTasks,
     current_user: UserResponse = Depends(get_current_user),
+    service: UserService = Depends(get_user_service),
 ):
     """
     Update a user's information.
@@ -237,8 +288,7 @@ async def update_user(
     - 403: Insufficient permissions (not co-president/VP, or VP trying to modify non-director)
     - 404: User not found
     """
-    service = UserService()
-    return service.update_user(user_id, request, current_user)
+    return await run_in_threadpool(service.update_user, user_id, request, current_user, background_tasks)
 
 
 @router.delete(
@@ -251,6 +301,7 @@ async def update_user(
 async def delete_user(
     user_id: UUID,
     current_user: UserResponse = Depends(get_current_user),
+    service: UserService = Depends(get_user_service),
 ):
     """
     Delete a user from the system.
@@ -275,5 +326,4 @@ async def delete_user(
     - This is a hard delete; the user will be permanently removed
     - Deletion cascades from auth.users to {schema}.users
     """
-    service = UserService()
-    return service.delete_user(user_id, current_user)
+    return await run_in_threadpool(service.delete_user, user_id, current_user)
@@ -0,0 +1,40 @@
+"""
+Per-process read cache of user rows.
+
+Kept out of the users service so the auth domain, which also writes the users
+table, can update it without importing the service.
+"""
+
+import threading
+from typing import Optional
+from uuid import UUID
+
+from cachetools import TTLCache
+
+from domains.auth.models import UserResponse
+
+# Short-lived cache of users by id. Updated on every write made through UserRepository
+# or AuthService.update_profile in this process; other workers/instances may serve a
+# stale row (including role/department) for at most the TTL.
+USER_CACHE_TTL_SECONDS = 30
+
+_user_cache: TTLCache[UUID, UserResponse] = TTLCache(maxsize=1024, ttl=USER_CACHE_TTL_SECONDS)
+_user_cache_lock = threading.Lock()
+
+
+def get_cached_user(user_id: UUID) -> Optional[UserResponse]:
+    """Return the cached user, or None if absent or expired."""
+    with _user_cache_lock:
+        return _user_cache.get(user_id)
+
+
+def cache_user(user: UserResponse) -> None:
+    """Store a freshly read or written user."""
+    with _user_cache_lock:
+        _user_cache[user.id] = user
+
+
+def invalidate_cached_user(user_id: UUID) -> None:
+    """Drop a user from the cache (e.g. after a delete)."""
+    with _user_cache_lock:
+        _user_cache.pop(user_id, None)
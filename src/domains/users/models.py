@@ -52,6 +52,7 @@ class UserListResponse(BaseModel):
     users: List[UserResponse]
     page: Optional[int] = None
     page_size: Optional[int] = None
+    next_cursor: Optional[str] = None
 
     model_config = ConfigDict(alias_generator=to_camel, populate_by_name=True)
 
@@ -4,14 +4,34 @@ Data access layer for user management.
 This module handles all database operations related to users.
 """
 
-from typing import List, Optional, Tuple, cast
+from datetime import datetime
+from typing import Iterator, List, Optional, Sequence, Tuple, cast
 from uuid import UUID
 
 from postgrest import CountMethod
+from pydantic import TypeAdapter
 from supabase import Client
 
+from core.database import get_schema_client
 from domains.auth.models import UserResponse
 
+from .cache import cache_user, get_cached_user, invalidate_cached_user
+
+# Columns matched by the `search` filter in UserRepository.get_all
+_SEARCH_COLUMNS = ("first_name", "last_name", "email", "display_role")
+
+# Makes a search term's LIKE wildcards literal ("\" is Postgres' default LIKE escape).
+# PostgREST rewrites every "*" in an ilike value to "%" and has no escape for it, so "*" is
+# narrowed to "_" (exactly one character) instead of matching anything.
+_LIKE_ESCAPES = str.maketrans({"\\": "\\\\", "%": "\\%", "_": "\\_", "*": "_"})
+
+# Columns backing UserResponse; fetched instead of "*" so unused/legacy columns stay in the database
+_USER_COLUMNS = ",".join(UserResponse.model_fields)
+
+# Validates a whole result set in one call instead of one UserResponse(**row) per row.
+# Rows still need validating: UUID/datetime/enum fields are compared as typed values by callers.
+_USER_LIST_ADAPTER = TypeAdapter(List[UserResponse])
+
 
 class UserRepository:
     """Repository for user data access operations."""
@@ -35,6 +55,7 @@ class UserRepository:
         search: Optional[str] = None,
         limit: Optional[int] = None,
         offset: Optional[int] = None,
+        after: Optional[Tuple[datetime, UUID]] = None,
     ) -> Tuple[List[UserResponse], int]:
         """
         Fetch all users with optional filtering and pagination.
@@ -43,37 +64,45 @@ class UserRepository:
             department_id: Filter by department
             role: Filter by role (co_president, vp, director)
             year: Filter by year (TODO: requires year field in users table)
-            search: Search in first_name, last_name, email, display_role
+            search: Search terms matched against first_name, last_name, email, display_role
             limit: Number of records to return
             offset: Number of records to skip
+            after: Keyset cursor (created_at, id) of the last row already seen; only rows
+                   after it in (created_at DESC, id DESC) order are returned. Use instead of offset.
 
         Returns:
-            Tuple of (list of users, total count)
+            Tuple of (list of users, total count). With `after`, the count covers only the
+            rows from the cursor onward.
         """
         # Build query
-        query = self.client.schema(self.schema).table("users").select("*", count=CountMethod.exact)
-
-        # Apply filters
-        if department_id is not None:
-            query = query.eq("department_id", str(department_id))
-
-        if role is not None:
-            query = query.eq("role", role)
-
-        # TODO: Add year filter when year column is added to users table
-        # if year is not None:
-        #     query = query.eq("year", year)
-
-        # Search filter (searches multiple fields)
-        if search:
-            search_lower = search.lower()
-            # Supabase doesn't support OR with ilike, so we do client-side filtering
-            # For now, we'll fetch all and filter in Python
-            # TODO: Consider using PostgreSQL full-text search for better performance
-            pass
+        query = (
+            get_schema_client(self.client, self.schema).table("users").select(_USER_COLUMNS, count=CountMethod.exact)
+        )
 
-        # Order by created_at descending (newest first)
-        query = query.order("created_at", desc=True)
+        # Apply equality filters in one call
+        # TODO: Add "year": year when year column is added to users table
+        filters = {"department_id": str(department_id) if department_id is not None else None, "role": role}
+        filters = {column: value for column, value in filters.items() if value is not None}
+        if filters:
+            query = query.match(filters)
+
+        # Search filter: every whitespace-separated term must appear (case-insensitive substring)
+        # in at least one searchable column, so "john smith" matches first + last name.
+        # Backed by pg_trgm GIN indexes (see add_user_search_indexes.sql).
+        for term in (search or "").split():
+            pattern = term.translate(_LIKE_ESCAPES)
+            # Then quote for PostgREST, where \ and " are escaped inside "..."
+            escaped = pattern.replace("\\", "\\\\").replace('"', '\\"')
+            query = query.or_(",".join(f'{column}.ilike."*{escaped}*"' for column in _SEARCH_COLUMNS))
+
+        # Keyset pagination: rows strictly after the cursor, id breaks created_at ties
+        if after is not None:
+            created_at, last_id = after
+            ts = created_at.isoformat()
+            query = query.or_(f'created_at.lt."{ts}",and(created_at.eq."{ts}",id.lt.{last_id})')
+
+        # Order by created_at descending (newest first), id as a stable tiebreaker
+        query = query.order("created_at", desc=True).order("id", desc=True)
 
         # Apply pagination
         if limit is not None:
@@ -87,24 +116,9 @@ class UserRepository:
         total_count = result.count if result.count is not None else 0
 
         if not result.data:
-            return [], 0
-
-        users = [UserResponse(**cast(dict, user)) for user in result.data]
-
-        # Client-side search filter if search query provided
-        if search:
-            search_lower = search.lower()
-            users = [
-                user
-                for user in users
-                if (
-                    search_lower in user.first_name.lower()
-                    or search_lower in user.last_name.lower()
-                    or search_lower in user.email.lower()
-                    or search_lower in user.display_role.lower()
-                )
-            ]
-            total_count = len(users)
+            return [], total_count
+
+        users = _USER_LIST_ADAPTER.validate_python(result.data)
 
         return users, total_count
 
@@ -118,57 +132,185 @@ class UserRepository:
         Returns:
             UserResponse if found, None otherwise
         """
-        result = self.client.schema(self.schema).table("users").select("*").eq("id", str(user_id)).execute()
+        result = (
+            get_schema_client(self.client, self.schema)
+            .table("users")
+            .select(_USER_COLUMNS)
+            .eq("id", str(user_id))
+            .execute()
+        )
 
         if not result.data or len(result.data) == 0:
+            invalidate_cached_user(user_id)
             return None
 
-        return UserResponse(**cast(dict, result.data[0]))
+        user = UserResponse(**cast(dict, result.data[0]))
+        cache_user(user)
+        return user
 
-    def get_users_with_notification_enabled(self, notification_type: str) -> List[UserResponse]:
+    def get_by_id_cached(self, user_id: UUID) -> Optional[UserResponse]:
         """
-        Fetch all users who have a specific notification type enabled.
+        Fetch user by ID, served from the per-process user cache when present.
 
-        Uses PostgreSQL JSONB querying to filter by notification_preferences.
+        The cached row reflects this process's last read or write and may be up to
+        USER_CACHE_TTL_SECONDS stale with respect to writes made by other workers.
 
         Args:
-            notification_type: Key in notification_preferences JSONB
-                              (e.g., 'rsvp_changes', 'new_application_submitted')
+            user_id: User UUID
 
         Returns:
-            List of users with notification enabled for the specified type
+            UserResponse if found, None otherwise
+        """
+        user = get_cached_user(user_id)
+        if user is not None:
+            return user
+        return self.get_by_id(user_id)
+
+    def exists(self, user_id: UUID) -> bool:
+        """
+        Check whether a user exists without fetching the row.
+
+        Sends a HEAD request with an exact count, so only the Content-Range header comes back.
+
+        Args:
+            user_id: User UUID
+
+        Returns:
+            True if the user exists, False otherwise
         """
-        # PostgreSQL JSONB query: notification_preferences->>'rsvp_changes' = 'true'
         result = (
-            self.client.schema(self.schema)
+            get_schema_client(self.client, self.schema)
             .table("users")
-            .select("*")
-            .eq(f"notification_preferences->>{notification_type}", "true")
+            .select("id", count=CountMethod.exact, head=True)
+            .eq("id", str(user_id))
             .execute()
         )
 
-        if not result.data:
-            return []
+        return bool(result.count)
+
+    def get_users_with_notification_enabled(self, notification_type: str) -> List[UserResponse]:
+        """
+        Fetch all users who have a specific notification type enabled.
+
+        Args:
+            notification_type: Key in notification_preferences JSONB
+                              (e.g., 'rsvp_changes', 'new_application_submitted')
+
+        Returns:
+            List of users with notification enabled for the specified type
+        """
+        return list(self.iter_users_with_notification_enabled(notification_type))
+
+    def iter_users_with_notification_enabled(
+        self, notification_type: str, chunk_size: int = 500
+    ) -> Iterator[UserResponse]:
+        """
+        Yield users who have a specific notification type enabled, one page at a time.
+
+        Uses JSONB containment (@>) on notification_preferences, which the
+        jsonb_path_ops GIN index serves directly. Rows are fetched in `chunk_size`
+        ranges ordered by id, so at most one chunk is held in memory.
 
-        return [UserResponse(**cast(dict, user)) for user in result.data]
+        Args:
+            notification_type: Key in notification_preferences JSONB
+                              (e.g., 'rsvp_changes', 'new_application_submitted')
+            chunk_size: Rows fetched per request
 
-    def update(self, user_id: UUID, update_data: dict) -> Optional[UserResponse]:
+        Yields:
+            UserResponse for each subscribed user
+        """
+        start = 0
+        while True:
+            # PostgreSQL JSONB query: notification_preferences @> '{"rsvp_changes": true}'
+            result = (
+                get_schema_client(self.client, self.schema)
+                .table("users")
+                .select(_USER_COLUMNS)
+                .contains("notification_preferences", {notification_type: True})
+                .order("id")
+                .range(start, start + chunk_size - 1)
+                .execute()
+            )
+
+            rows = result.data or []
+            yield from _USER_LIST_ADAPTER.validate_python(rows)
+
+            if len(rows) < chunk_size:
+                return
+            start += chunk_size
+
+    def update(
+        self,
+        user_id: UUID,
+        update_data: dict,
+        guards: Sequence[Tuple[str, str, str]] = (),
+    ) -> Optional[UserResponse]:
         """
         Update user by ID.
 
+        The updated row comes back in the same request (UPDATE ... RETURNING).
+
         Args:
             user_id: User UUID
             update_data: Dictionary of fields to update
+            guards: Extra (column, operator, value) filters the row must also match,
+                    e.g. ("role", "eq", "director") for permission checks
 
         Returns:
-            Updated UserResponse if found, None otherwise
+            Updated UserResponse if a matching row was updated, None otherwise
         """
-        result = self.client.schema(self.schema).table("users").update(update_data).eq("id", str(user_id)).execute()
+        query = get_schema_client(self.client, self.schema).table("users").update(update_data).eq("id", str(user_id))
+        for column, operator, value in guards:
+            query = query.filter(column, operator, value)
 
-        if not result.data or len(result.data) == 0:
+        result = query.execute()
+
+        if not result.data:
             return None
 
-        return UserResponse(**cast(dict, result.data[0]))
+        user = UserResponse(**cast(dict, result.data[0]))
+        cache_user(user)
+        return user
+
+    def bulk_update(
+        self,
+        user_ids: Sequence[UUID],
+        update_data: dict,
+        guards: Sequence[Tuple[str, str, str]] = (),
+    ) -> Tuple[List[UserResponse], List[UUID]]:
+        """
+        Apply the same update to several users in one request.
+
+        Permission rules go in `guards` (same shape as in `update`), so rows the
+        caller may not touch are simply not matched instead of being checked one by one.
+
+        Args:
+            user_ids: User UUIDs to update
+            update_data: Dictionary of fields to update
+            guards: Extra (column, operator, value) filters each row must also match
+
+        Returns:
+            Tuple of (updated users, ids that were not updated: missing or not permitted)
+        """
+        if not user_ids:
+            return [], []
+
+        query = (
+            get_schema_client(self.client, self.schema)
+            .table("users")
+            .update(update_data)
+            .in_("id", [str(user_id) for user_id in user_ids])
+        )
+        for column, operator, value in guards:
+            query = query.filter(column, operator, value)
+
+        result = query.execute()
+
+        updated = _USER_LIST_ADAPTER.validate_python(result.data or [])
+        for user in updated:
+            cache_user(user)
+        updated_ids = {user.id for user in updated}
+        return updated, [user_id for user_id in user_ids if user_id not in updated_ids]
 
     def delete(self, user_id: UUID) -> bool:
         """
@@ -183,6 +325,41 @@ class UserRepository:
         Returns:
             True if user was deleted, False if not found
         """
-        result = self.client.schema(self.schema).table("users").delete().eq("id", str(user_id)).execute()
+        result = get_schema_client(self.client, self.schema).table("users").delete().eq("id", str(user_id)).execute()
+        invalidate_cached_user(user_id)
 
         return len(result.data) > 0 if result.data else False
+
+    def merge_auth_metadata(self, auth_user_id: UUID, patch: dict) -> None:
+        """
+        Merge fields into auth.users.user_metadata in a single request.
+
+        Runs `raw_user_meta_data || patch` server-side (merge_auth_user_metadata RPC),
+        so there is no read-modify-write from the API.
+
+        Args:
+            auth_user_id: Supabase Auth user ID
+            patch: Metadata fields to set
+        """
+        get_schema_client(self.client, self.schema).rpc(
+            "merge_auth_user_metadata", {"uid": str(auth_user_id), "patch": patch}
+        ).execute()
+
+    def verify_password(self, auth_user_id: UUID, password: str) -> bool:
+        """
+        Check a password against the user's stored auth hash (verify_user_password RPC).
+
+        Args:
+            auth_user_id: Supabase Auth user ID
+            password: Plain-text password to check
+
+        Returns:
+            True if the password matches, False otherwise
+        """
+        result = (
+            get_schema_client(self.client, self.schema)
+            .rpc("verify_user_password", {"uid": str(auth_user_id), "password": password})
+            .execute()
+        )
+
+        return result.data is True
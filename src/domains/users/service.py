@@ -4,18 +4,21 @@ User service - Business logic for user management operations.
 This module handles business logic for user management.
 """
 
+import base64
 import logging
-from typing import Optional
+from datetime import datetime
+from functools import cached_property
+from typing import Callable, Dict, FrozenSet, List, Optional, Tuple, get_args
 from uuid import UUID
 
-from fastapi import HTTPException, status
-from supabase import Client, create_client
-from supabase_auth.errors import AuthApiError, AuthInvalidCredentialsError
+from fastapi import BackgroundTasks, HTTPException, status
+from supabase import Client
 
-from core.config import get_settings
-from core.database import get_schema, get_supabase_client
-from domains.auth.models import UserResponse
+from core.config import Settings, get_settings
+from core.database import get_schema, get_supabase_admin_client
+from domains.auth.models import UserResponse, UserRole
 
+from .cache import invalidate_cached_user
 from .models import (
     ChangePasswordRequest,
     ChangePasswordResponse,
@@ -30,17 +33,33 @@ logger = logging.getLogger(__name__)
 # Error message constants
 USER_NOT_FOUND = "User not found"
 
+# (column, operator, value) filter applied to a guarded write
+Guard = Tuple[str, str, str]
+
+ALL_ROLES: FrozenSet[str] = frozenset(get_args(UserRole))
+
+# Who may manage whom: role -> (target roles it can manage, target must be in its department).
+# Roles not listed cannot manage anyone. Read by both _can_manage_user and _management_guards.
+MANAGEMENT_POLICY: Dict[str, Tuple[FrozenSet[str], bool]] = {
+    # Co-presidents can manage anyone
+    "co_president": (ALL_ROLES, False),
+    # VPs can only manage directors in their department
+    "vp": (frozenset({"director"}), True),
+}
+
 
 class UserService:
     """Service class for user management operations."""
 
     def __init__(self):
-        self.settings = get_settings()
         self.schema = get_schema()
-        self.supabase = get_supabase_client()
-        self._admin_client: Optional[Client] = None
         self.repository = UserRepository(self._get_admin_client(), self.schema)
 
+    # Not needed by any user operation; resolved only if something asks for it
+    @cached_property
+    def settings(self) -> Settings:
+        return get_settings()
+
     def _get_admin_client(self) -> Client:
         """
         Get Supabase client with service role key for admin operations.
@@ -49,11 +68,47 @@ class UserService:
         by requiring authentication.
 
         Returns:
-            Client: Supabase client with admin privileges
+            Client: Shared (process-wide) Supabase client with admin privileges
+        """
+        client: Client = get_supabase_admin_client()
+        return client
+
+    @staticmethod
+    def _encode_cursor(user: UserResponse) -> str:
+        """
+        Build an opaque keyset cursor from the last user on a page.
+
+        Args:
+            user: Last user returned
+
+        Returns:
+            URL-safe cursor string
+        """
+        raw = f"{user.created_at.isoformat()}|{user.id}"
+        return base64.urlsafe_b64encode(raw.encode()).decode()
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+        """
+        Parse a cursor produced by _encode_cursor.
+
+        Args:
+            cursor: Cursor string from a previous response
+
+        Returns:
+            Tuple of (created_at, id) of the last user seen
+
+        Raises:
+            HTTPException: If the cursor is malformed
         """
-        if self._admin_client is None:
-            self._admin_client = create_client(self.settings.SUPABASE_URL, self.settings.SUPABASE_SERVICE_ROLE_KEY)
-        return self._admin_client
+        try:
+            created_at, user_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+            return datetime.fromisoformat(created_at), UUID(user_id)
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid cursor",
+            ) from e
 
     def get_users(
         self,
@@ -63,6 +118,7 @@ class UserService:
         search: Optional[str] = None,
         page: Optional[int] = None,
         page_size: Optional[int] = None,
+        cursor: Optional[str] = None,
     ) -> UserListResponse:
         """
         Get list of users with optional filtering and pagination.
@@ -74,28 +130,47 @@ class UserService:
             search: Search query for name/email/role
             page: Page number (1-indexed)
             page_size: Number of items per page
+            cursor: next_cursor from a previous page; replaces page-based offsets
 
         Returns:
             UserListResponse with users and metadata
 
         Raises:
-            HTTPException: If retrieval fails
+            HTTPException: If the cursor is malformed, is combined with page or lacks
+                page_size, or retrieval fails
         """
         try:
             # Calculate offset for pagination
             limit = None
             offset = None
+            after = self._decode_cursor(cursor) if cursor else None
 
-            if page is not None and page_size is not None:
-                if page < 1:
+            if page_size is not None and page_size < 1:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Page size must be >= 1",
+                )
+
+            if after is not None:
+                # Keyset pagination: the cursor already marks where the page starts, so
+                # a page number would be silently ignored and no page_size means no limit
+                if page is not None:
                     raise HTTPException(
                         status_code=status.HTTP_400_BAD_REQUEST,
-                        detail="Page must be >= 1",
+                        detail="cursor cannot be combined with page",
                     )
-                if page_size < 1:
+                if page_size is None:
                     raise HTTPException(
                         status_code=status.HTTP_400_BAD_REQUEST,
-                        detail="Page size must be >= 1",
+                        detail="cursor requires page_size",
+                    )
+
+                limit = page_size
+            elif page is not None and page_size is not None:
+                if page < 1:
+                    raise HTTPException(
+                        status_code=status.HTTP_400_BAD_REQUEST,
+                        detail="Page must be >= 1",
                     )
 
                 limit = page_size
@@ -106,32 +181,44 @@ class UserService:
                 role=role,
                 year=year,
                 search=search,
-                limit=limit,
+                # One extra row tells us whether another page exists
+                limit=limit + 1 if limit is not None else None,
                 offset=offset,
+                after=after,
             )
 
-            return UserListResponse(
+            # Only hand back a cursor when there really is a next page
+            next_cursor = None
+            if limit is not None and len(users) > limit:
+                users = users[:limit]
+                next_cursor = self._encode_cursor(users[-1])
+
+            # Users are already validated UserResponse models; skip re-validating the wrapper
+            return UserListResponse.model_construct(
                 total=total,
                 users=users,
                 page=page,
                 page_size=page_size,
+                next_cursor=next_cursor,
             )
 
         except HTTPException:
             raise
         except Exception as e:
-            logger.error(f"Error fetching users: {e}")
+            logger.exception("Error fetching users")
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Failed to fetch users: {str(e)}",
             ) from e
 
-    def get_user_by_id(self, user_id: UUID) -> UserResponse:
+    def get_user_by_id(self, user_id: UUID, fresh: bool = False) -> UserResponse:
         """
         Get user by ID.
 
         Args:
             user_id: User UUID
+            fresh: Read from the database instead of the per-process cache, which may be
+                   up to USER_CACHE_TTL_SECONDS stale with respect to other workers' writes
 
         Returns:
             UserResponse
@@ -140,7 +227,7 @@ class UserService:
             HTTPException: If user not found or retrieval fails
         """
         try:
-            user = self.repository.get_by_id(user_id)
+            user = self.repository.get_by_id(user_id) if fresh else self.repository.get_by_id_cached(user_id)
 
             if not user:
                 raise HTTPException(
@@ -153,7 +240,7 @@ class UserService:
         except HTTPException:
             raise
         except Exception as e:
-            logger.error(f"Error fetching user: {e}")
+            logger.exception("Error fetching user %s", user_id)
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Failed to fetch user: {str(e)}",
@@ -170,19 +257,17 @@ class UserService:
         Returns:
             bool: True if current user can manage target user
         """
-        # Co-presidents can manage anyone
-        if current_user.role == "co_president":
-            return True
-
-        # VPs can only manage directors in their department
-        if current_user.role == "vp":
-            return (
-                target_user.role == "director"
-                and target_user.department_id == current_user.department_id
-                and target_user.department_id is not None
-            )
+        policy = MANAGEMENT_POLICY.get(current_user.role)
+        if policy is None:
+            return False
+
+        target_roles, same_department = policy
+        if target_user.role not in target_roles:
+            return False
 
-        return False
+        return not same_department or (
+            target_user.department_id is not None and target_user.department_id == current_user.department_id
+        )
 
     def _validate_update_permissions(
         self,
@@ -231,6 +316,109 @@ class UserService:
                 detail="Only co-presidents can change user departments",
             )
 
+    def _management_guards(self, current_user: UserResponse) -> Optional[List[Guard]]:
+        """
+        Express _can_manage_user as filters on the target row.
+
+        Args:
+            current_user: User performing the action
+
+        Returns:
+            Filters a manageable target row must match, or None if the current
+            user cannot manage anyone (the write can be skipped)
+        """
+        policy = MANAGEMENT_POLICY.get(current_user.role)
+        if policy is None:
+            return None
+
+        target_roles, same_department = policy
+        guards: List[Guard] = []
+        if target_roles != ALL_ROLES:
+            guards.append(("role", "in", f"({','.join(sorted(target_roles))})"))
+        if same_department:
+            if current_user.department_id is None:
+                return None
+            guards.append(("department_id", "eq", str(current_user.department_id)))
+        return guards
+
+    def _update_guards(self, request: UpdateUserRequest, current_user: UserResponse) -> Optional[List[Guard]]:
+        """
+        Express _validate_update_permissions as filters on the target row.
+
+        Args:
+            request: Update request with fields to change
+            current_user: User performing the update
+
+        Returns:
+            Filters the target row must match for the update to be allowed, or
+            None if no target could satisfy them
+        """
+        guards = self._management_guards(current_user)
+        if guards is None:
+            return None
+
+        if current_user.role == "co_president":
+            # Anyone but a co-president may have their role changed
+            if request.role is not None and request.role != "co_president":
+                guards.append(("role", "neq", "co_president"))
+            return guards
+
+        # VPs only manage directors in their own department, so any other role or
+        # department in the request is a change they are not allowed to make
+        if request.role is not None and request.role != "director":
+            return None
+        if request.department_id is not None and request.department_id != current_user.department_id:
+            return None
+        return guards
+
+    def _raise_for_rejected_write(
+        self, user_id: UUID, guards: Optional[List[Guard]], validate: Callable[[UserResponse], None]
+    ) -> None:
+        """
+        Work out why a guarded write matched no row and raise the matching error.
+
+        Only runs on the failure path, so the happy path stays a single request.
+
+        Args:
+            user_id: ID of the target user
+            guards: Guards the write was attempted with (None if it was skipped)
+            validate: Permission check that raises HTTPException for the target user
+
+        Raises:
+            HTTPException: 404 if the user does not exist, otherwise whatever
+                           validate raises
+        """
+        if guards == []:
+            # Nothing was filtered on permissions, so only existence is in question
+            if not self.repository.exists(user_id):
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=USER_NOT_FOUND,
+                )
+            return
+
+        target_user = self.repository.get_by_id(user_id)
+        if not target_user:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=USER_NOT_FOUND,
+            )
+
+        validate(target_user)
+
+    @staticmethod
+    def _changed_fields(request: UpdateUserRequest) -> dict:
+        """
+        Collect the fields set on an update request as JSON-ready values.
+
+        Args:
+            request: Update request with fields to change
+
+        Returns:
+            Dictionary of non-null fields (UUIDs and enums as strings)
+        """
+        return request.model_dump(mode="json", exclude_none=True)
+
     def _build_update_data(self, request: UpdateUserRequest) -> dict:
         """
         Build update data dictionary from request.
@@ -244,17 +432,7 @@ class UserService:
         Raises:
             HTTPException: If no fields to update
         """
-        update_data = {}
-        if request.first_name is not None:
-            update_data["first_name"] = request.first_name
-        if request.last_name is not None:
-            update_data["last_name"] = request.last_name
-        if request.display_role is not None:
-            update_data["display_role"] = request.display_role
-        if request.role is not None:
-            update_data["role"] = request.role
-        if request.department_id is not None:
-            update_data["department_id"] = str(request.department_id)
+        update_data = self._changed_fields(request)
 
         if not update_data:
             raise HTTPException(
@@ -277,40 +455,24 @@ class UserService:
             request: The update request containing fields to sync
         """
         try:
-            metadata_update = {}
-            if request.first_name is not None:
-                metadata_update["first_name"] = request.first_name
-            if request.last_name is not None:
-                metadata_update["last_name"] = request.last_name
-            if request.display_role is not None:
-                metadata_update["display_role"] = request.display_role
-            if request.role is not None:
-                metadata_update["role"] = request.role
-            if request.department_id is not None:
-                metadata_update["department_id"] = str(request.department_id)
+            metadata_update = self._changed_fields(request)
 
             if not metadata_update:
                 return
 
-            admin_client = self._get_admin_client()
-
-            # Get current metadata first
-            auth_user = admin_client.auth.admin.get_user_by_id(str(target_user.user_id))
-            current_metadata = auth_user.user.user_metadata or {}
-
-            # Merge updates into existing metadata
-            updated_metadata = {**current_metadata, **metadata_update}
-
-            # Update auth user metadata
-            admin_client.auth.admin.update_user_by_id(
-                uid=str(target_user.user_id),
-                attributes={"user_metadata": updated_metadata},
-            )
+            # Merged server-side; one request, no lost updates between concurrent edits
+            self.repository.merge_auth_metadata(target_user.user_id, metadata_update)
         except Exception as e:
-            logger.warning(f"Failed to update auth metadata: {e}")
+            logger.warning("Failed to update auth metadata: %s", e)
             # Continue even if metadata update fails (users table is source of truth)
 
-    def update_user(self, user_id: UUID, request: UpdateUserRequest, current_user: UserResponse) -> UserResponse:
+    def update_user(
+        self,
+        user_id: UUID,
+        request: UpdateUserRequest,
+        current_user: UserResponse,
+        background_tasks: Optional[BackgroundTasks] = None,
+    ) -> UserResponse:
         """
         Update a user's information.
 
@@ -318,6 +480,7 @@ class UserService:
             user_id: ID of user to update
             request: Update request with fields to change
             current_user: User performing the update
+            background_tasks: If given, the auth metadata sync runs after the response is sent
 
         Returns:
             UserResponse: Updated user data
@@ -326,43 +489,58 @@ class UserService:
             HTTPException: If update fails or user lacks permission
         """
         try:
-            # 1. Fetch target user
-            target_user = self.repository.get_by_id(user_id)
-            if not target_user:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=USER_NOT_FOUND,
-                )
-
-            # 2. Validate permissions for requested changes
-            self._validate_update_permissions(request, current_user, target_user)
-
-            # 3. Build update data
+            # 1. Build update data
             update_data = self._build_update_data(request)
 
-            # 4. Update users table via repository
-            updated_user = self.repository.update(user_id, update_data)
+            # 2. Update users table, with the permission rules applied as filters so the
+            #    existence check, permission check and write are one request
+            guards = self._update_guards(request, current_user)
+            updated_user = self.repository.update(user_id, update_data, guards) if guards is not None else None
 
             if not updated_user:
+                # 3. Nothing matched: report not found / forbidden like an explicit check would
+                self._raise_for_rejected_write(
+                    user_id, guards, lambda target: self._validate_update_permissions(request, current_user, target)
+                )
                 raise HTTPException(
                     status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                     detail="Failed to update user",
                 )
 
-            # 5. Sync auth.users.user_metadata (non-blocking)
-            self._sync_auth_metadata(target_user, request)
+            # 4. Sync auth.users.user_metadata (non-blocking, off the response path when possible)
+            if background_tasks is not None:
+                background_tasks.add_task(self._sync_auth_metadata, updated_user, request)
+            else:
+                self._sync_auth_metadata(updated_user, request)
 
             return updated_user
 
         except HTTPException:
             raise
         except Exception as e:
-            logger.error(f"Error updating user: {e}")
+            logger.exception("Error updating user %s", user_id)
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Failed to update user: {str(e)}",
             ) from e
 
+    def _validate_delete_permissions(self, current_user: UserResponse, target_user: UserResponse) -> None:
+        """
+        Validate that current user has permission to delete the target user.
+
+        Args:
+            current_user: User performing the deletion
+            target_user: User being deleted
+
+        Raises:
+            HTTPException: If user lacks permission
+        """
+        if not self._can_manage_user(current_user, target_user):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="You don't have permission to delete this user",
+            )
+
     def delete_user(self, user_id: UUID, current_user: UserResponse) -> DeleteUserResponse:
         """
         Delete a user from the system.
@@ -394,16 +572,14 @@ class UserService:
                 )
 
             # 3. Validate permission
-            if not self._can_manage_user(current_user, target_user):
-                raise HTTPException(
-                    status_code=status.HTTP_403_FORBIDDEN,
-                    detail="You don't have permission to delete this user",
-                )
+            self._validate_delete_permissions(current_user, target_user)
 
             # 4. Delete from auth.users (will cascade to {schema}.users)
             admin_client = self._get_admin_client()
             admin_client.auth.admin.delete_user(str(target_user.user_id))
 
+            invalidate_cached_user(user_id)
+
             return DeleteUserResponse(
                 success=True,
                 message=f"User {target_user.email} has been deleted",
@@ -413,7 +589,7 @@ class UserService:
         except HTTPException:
             raise
         except Exception as e:
-            logger.error(f"Error deleting user: {e}")
+            logger.exception("Error deleting user %s", user_id)
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Failed to delete user: {str(e)}",
@@ -446,45 +622,35 @@ class UserService:
                 detail="Password must be at least 8 characters",
             )
 
-    def _verify_current_password(self, email: str, current_password: str) -> None:
+    def _verify_current_password(self, auth_user_id: UUID, current_password: str) -> None:
         """
-        Verify that the current password is correct by attempting sign in.
+        Verify that the current password is correct against the stored hash.
+
+        Uses the verify_user_password RPC instead of a full sign-in, so no session
+        or tokens are minted just to be thrown away.
 
         Args:
-            email: User's email
+            auth_user_id: Supabase Auth user ID
             current_password: Current password to verify
 
         Raises:
             HTTPException: If current password is incorrect or verification fails
         """
         try:
-            temp_client = create_client(self.settings.SUPABASE_URL, self.settings.SUPABASE_KEY)
-            auth_response = temp_client.auth.sign_in_with_password(
-                {
-                    "email": email,
-                    "password": current_password,
-                }
-            )
-
-            if not (auth_response.session and auth_response.user):
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="Current password is incorrect",
-                )
-        except HTTPException:
-            raise
-        except (AuthInvalidCredentialsError, AuthApiError) as e:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Current password is incorrect",
-            ) from e
+            is_valid = self.repository.verify_password(auth_user_id, current_password)
         except Exception as e:
-            logger.error(f"Error verifying current password: {e}")
+            logger.exception("Error verifying current password")
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Failed to verify current password",
             ) from e
 
+        if not is_valid:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Current password is incorrect",
+            )
+
     def _update_password_in_supabase(self, auth_user_id: UUID, new_password: str) -> None:
         """
         Update user password in Supabase Auth.
@@ -503,7 +669,7 @@ class UserService:
                 attributes={"password": new_password},
             )
         except Exception as e:
-            logger.error(f"Error updating password: {e}")
+            logger.exception("Error updating password")
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Failed to update password",
@@ -528,7 +694,7 @@ class UserService:
             self._validate_new_password(request.new_password, request.confirm_password)
 
             # Verify current password
-            self._verify_current_password(current_user.email, request.current_password)
+            self._verify_current_password(current_user.user_id, request.current_password)
 
             # Update password
             self._update_password_in_supabase(current_user.user_id, request.new_password)
@@ -538,7 +704,7 @@ class UserService:
         except HTTPException:
             raise
         except Exception as e:
-            logger.error(f"Error changing password: {e}")
+            logger.exception("Error changing password")
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Failed to change password: {str(e)}",
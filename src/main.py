@@ -9,25 +9,45 @@ Environment:
 - Automatically connects to the correct schema based on ENVIRONMENT variable
 """
 
+import atexit
 import logging
+import queue
 from contextlib import asynccontextmanager
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
 
+import orjson
+from anyio import to_thread
 from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.openapi.docs import get_redoc_html, get_swagger_ui_html
+from fastapi.responses import ORJSONResponse, Response
+from postgrest import CountMethod
 
 from api.v1.router import api_router
 from core.config import get_settings
-from core.database import get_schema, get_supabase_client
+from core.database import get_schema, get_schema_client, get_supabase_admin_client, get_supabase_client
+from utils.rate_limit import start_reaper
 
 # Get settings instance
 settings = get_settings()
 
-# Configure logging with level from settings
+# Configure logging with level from settings.
+# Request handlers only enqueue records; a background listener thread formats and writes them,
+# so a burst of log lines doesn't stall requests on stdout.
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s"))
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_log_listener = QueueListener(_log_queue, _log_handler, respect_handler_level=True)
+_queue_handler = QueueHandler(_log_queue)
+_queue_handler.setFormatter(logging.Formatter("%(message)s"))  # final formatting happens in the listener
 logging.basicConfig(
     level=getattr(logging, settings.LOG_LEVEL.upper()),
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    handlers=[_queue_handler],
 )
+_log_listener.start()
+atexit.register(_log_listener.stop)  # flush queued records on exit
 
 # Quiet noisy third-party loggers when in DEBUG mode
 # These libraries log excessively at DEBUG level
@@ -40,6 +60,9 @@ if settings.LOG_LEVEL.upper() == "DEBUG":
 
 logger = logging.getLogger(__name__)
 
+# Set once the Supabase clients have been created, so /health doesn't touch them on every probe
+_supabase_ready = False
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -70,21 +93,38 @@ async def lifespan(app: FastAPI):
         print("-" * 60)
         print()
 
+    # Size the threadpool that runs blocking Supabase calls
+    to_thread.current_default_thread_limiter().total_tokens = settings.THREADPOOL_SIZE
+
     # Initialize Supabase client (cached)
+    global _supabase_ready
     try:
         _ = get_supabase_client()
+        _ = get_supabase_admin_client()
+        _supabase_ready = True
         print("SUCCESS: Connected to Supabase")
     except Exception as e:
         print(f"ERROR: Failed to connect to Supabase: {e}")
         raise
 
+    # Build and serialize the OpenAPI schema once, before the first request
+    _ = openapi_json_bytes()
+
+    # Drop idle rate limit clients in the background instead of on the request path
+    rate_limit_reaper = start_reaper()
+
     yield
 
     # Shutdown
+    rate_limit_reaper.cancel()
     print("UTESCA Portal API - Shutting down")
 
 
+OPENAPI_URL = f"{settings.API_V1_PREFIX}/openapi.json"
+
 # Create FastAPI application
+# The built-in docs routes are disabled; they are registered below so the schema
+# is served from pre-serialized bytes instead of being re-encoded on every request.
 app = FastAPI(
     title=settings.PROJECT_NAME,
     version="1.0.0",
@@ -92,9 +132,10 @@ app = FastAPI(
     Internal management system for the University of Toronto
     Engineering Student Club Association.
     """,
-    openapi_url=f"{settings.API_V1_PREFIX}/openapi.json",
-    docs_url=f"{settings.API_V1_PREFIX}/docs",
-    redoc_url=f"{settings.API_V1_PREFIX}/redoc",
+    openapi_url=None,
+    docs_url=None,
+    redoc_url=None,
+    default_response_class=ORJSONResponse,
     lifespan=lifespan,
 )
 
@@ -103,9 +144,12 @@ app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.ALLOWED_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],  # Allow all HTTP methods
-    allow_headers=["*"],  # Allow all headers
-    expose_headers=["*"],
+    # Explicit lists let the middleware build its preflight response headers once
+    # instead of echoing each request's Access-Control-Request-Headers
+    allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
+    allow_headers=["Authorization", "Content-Type", "If-None-Match"],
+    # "*" is not honoured for credentialed requests, so name the headers the frontend reads
+    expose_headers=["Content-Disposition", "ETag"],
 )
 
 
@@ -113,6 +157,28 @@ app.add_middleware(
 app.include_router(api_router, prefix=settings.API_V1_PREFIX)
 
 
+# API documentation
+@lru_cache(maxsize=1)
+def openapi_json_bytes() -> bytes:
+    """OpenAPI schema serialized once; routes don't change after startup."""
+    return orjson.dumps(app.openapi())
+
+
+@app.get(OPENAPI_URL, include_in_schema=False)
+async def openapi_json():
+    return Response(openapi_json_bytes(), media_type="application/json")
+
+
+@app.get(f"{settings.API_V1_PREFIX}/docs", include_in_schema=False)
+async def swagger_ui():
+    return get_swagger_ui_html(openapi_url=OPENAPI_URL, title=f"{app.title} - Swagger UI")
+
+
+@app.get(f"{settings.API_V1_PREFIX}/redoc", include_in_schema=False)
+async def redoc():
+    return get_redoc_html(openapi_url=OPENAPI_URL, title=f"{app.title} - ReDoc")
+
+
 # Root endpoint
 @app.get("/", tags=["Health"])
 async def root():
@@ -121,7 +187,7 @@ async def root():
 
     Returns basic information about the API and its current configuration.
     """
-    return JSONResponse(
+    return ORJSONResponse(
         {
             "message": "UTESCA Portal API",
             "version": "1.0.0",
@@ -140,12 +206,17 @@ async def health_check():
     Health check endpoint.
 
     Used by deployment platforms (Vercel, etc.) to verify the API is running.
+    Only checks that the Supabase client was initialized; use /health/deep to
+    test an actual database round trip.
     """
+    global _supabase_ready
     try:
-        # Test database connection
-        _ = get_supabase_client()
+        if not _supabase_ready:
+            # Startup hook didn't run (e.g. TestClient without a context manager)
+            _ = get_supabase_client()
+            _supabase_ready = True
 
-        return JSONResponse(
+        return ORJSONResponse(
             {
                 "status": "healthy",
                 "environment": settings.ENVIRONMENT,
@@ -154,12 +225,45 @@ async def health_check():
             }
         )
     except Exception as e:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=503,
             content={"status": "unhealthy", "error": str(e), "database_connected": False},
         )
 
 
+@app.get("/health/deep", tags=["Health"])
+async def deep_health_check():
+    """
+    Deep health check endpoint.
+
+    Makes one lightweight query against Supabase. Meant for on-call tooling,
+    not for frequent liveness probes.
+    """
+
+    def probe() -> None:
+        db = get_schema_client(get_supabase_admin_client(), get_schema())
+        db.table("departments").select("id", count=CountMethod.exact, head=True).execute()
+
+    try:
+        await run_in_threadpool(probe)
+        return ORJSONResponse(
+            {
+                "status": "healthy",
+                "environment": settings.ENVIRONMENT,
+                "database_schema": get_schema(),
+                "database_connected": True,
+            }
+        )
+    except Exception as e:
+        logger.warning("Deep health check failed: %s", e)
+        # The endpoint is unauthenticated; don't expose database error text in production
+        error_detail = None if settings.is_production else str(e)
+        return ORJSONResponse(
+            status_code=503,
+            content={"status": "unhealthy", "error": error_detail, "database_connected": False},
+        )
+
+
 # Global exception handler
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
@@ -168,16 +272,16 @@ async def global_exception_handler(request, exc):
 
     Logs the error and returns a generic error response to the client.
     """
-    print(f"ERROR: Unhandled exception: {exc}")
+    logger.exception("Unhandled exception", exc_info=exc)
 
     # In production, don't expose internal error details
-    error_detail = str(exc) if not settings.is_production else "Internal server error"
+    error_detail = None if settings.is_production else str(exc)
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "error": "Internal server error",
-            "detail": error_detail if not settings.is_production else None,
+            "detail": error_detail,
         },
     )
 
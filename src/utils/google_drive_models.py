@@ -16,12 +16,14 @@ class GoogleDriveDirectLinkResponse(BaseModel):
     direct_url: Optional[str] = Field(None, description="The generated direct download link")
     error: Optional[str] = Field(None, description="Error message if link generation failed")
 
+    # Frozen: generate_direct_link caches and shares instances
     model_config = ConfigDict(
+        frozen=True,
         json_schema_extra={
             "example": {
                 "original_url": "https://drive.google.com/file/d/1GgjItC8Ly5fbWXsbe8fKaC0irR-KE6S_/view?usp=sharing",
                 "direct_url": "https://drive.google.com/uc?export=download&id=1GgjItC8Ly5fbWXsbe8fKaC0irR-KE6S_",
                 "error": None,
             }
-        }
+        },
     )
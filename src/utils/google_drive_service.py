@@ -5,10 +5,16 @@ This module handles generating direct download links from Google Drive URLs.
 """
 
 import re
+from functools import lru_cache
 from typing import Optional
 
 from .google_drive_models import GoogleDriveDirectLinkResponse
 
+# File ID after any of: /file/d/, /folders/, ?id= or &id=, /d/ (one scan; the first marker in the URL wins)
+_FILE_ID_RE = re.compile(r"(?:/file/d/|/folders/|[?&]id=|/d/)(?P<id>[a-zA-Z0-9_-]+)")
+# Substrings at least one of which must be present for _FILE_ID_RE to match ("/file/d/" contains "/d/")
+_FILE_ID_MARKERS = ("/d/", "/folders/", "id=")
+
 
 def _extract_file_id(url: str) -> Optional[str]:
     """
@@ -33,33 +39,15 @@ def _extract_file_id(url: str) -> Optional[str]:
     if not url or not isinstance(url, str):
         return None
 
-    # Pattern 1: /file/d/{fileId}/
-    pattern1 = r"/file/d/([a-zA-Z0-9_-]+)"
-    match = re.search(pattern1, url)
-    if match:
-        return match.group(1)
-
-    # Pattern 2: /folders/{fileId}
-    pattern2 = r"/folders/([a-zA-Z0-9_-]+)"
-    match = re.search(pattern2, url)
-    if match:
-        return match.group(1)
-
-    # Pattern 3: ?id={fileId} or &id={fileId}
-    pattern3 = r"[?&]id=([a-zA-Z0-9_-]+)"
-    match = re.search(pattern3, url)
-    if match:
-        return match.group(1)
-
-    # Pattern 4: /d/{fileId}/ (more general pattern)
-    pattern4 = r"/d/([a-zA-Z0-9_-]+)"
-    match = re.search(pattern4, url)
-    if match:
-        return match.group(1)
+    # Cheap substring probe before running the regex
+    if not any(marker in url for marker in _FILE_ID_MARKERS):
+        return None
 
-    return None
+    match = _FILE_ID_RE.search(url)
+    return match.group("id") if match else None
 
 
+@lru_cache(maxsize=4096)
 def generate_direct_link(url: str) -> GoogleDriveDirectLinkResponse:
     """
     Generate a direct download link from a Google Drive URL.
@@ -68,6 +56,9 @@ def generate_direct_link(url: str) -> GoogleDriveDirectLinkResponse:
     and generates a direct download link that immediately starts downloading
     the file rather than opening a preview.
 
+    Results are memoized (bounded to 4096 URLs); the returned model is frozen
+    because the same instance is handed to every caller.
+
     Args:
         url: Google Drive URL (various formats supported)
 
@@ -79,9 +70,11 @@ def generate_direct_link(url: str) -> GoogleDriveDirectLinkResponse:
         >>> print(result.direct_url)
         "https://drive.google.com/uc?export=download&id=1Ggj..."
     """
+    # Responses skip validation (model_construct): every field is a literal or an already-checked str
+
     # Validate input
     if not url or not isinstance(url, str):
-        return GoogleDriveDirectLinkResponse(
+        return GoogleDriveDirectLinkResponse.model_construct(
             original_url=url or "", direct_url=None, error="Invalid URL: URL must be a non-empty string"
         )
 
@@ -89,7 +82,7 @@ def generate_direct_link(url: str) -> GoogleDriveDirectLinkResponse:
 
     # Check if it's a Google Drive URL
     if "drive.google.com" not in url:
-        return GoogleDriveDirectLinkResponse(
+        return GoogleDriveDirectLinkResponse.model_construct(
             original_url=url, direct_url=None, error="Invalid URL: Not a Google Drive URL"
         )
 
@@ -97,11 +90,11 @@ def generate_direct_link(url: str) -> GoogleDriveDirectLinkResponse:
     file_id = _extract_file_id(url)
 
     if not file_id:
-        return GoogleDriveDirectLinkResponse(
+        return GoogleDriveDirectLinkResponse.model_construct(
             original_url=url, direct_url=None, error="Invalid URL: Could not extract file ID from Google Drive URL"
         )
 
     # Generate direct download link
     direct_url = f"https://drive.google.com/uc?export=download&id={file_id}"
 
-    return GoogleDriveDirectLinkResponse(original_url=url, direct_url=direct_url, error=None)
+    return GoogleDriveDirectLinkResponse.model_construct(original_url=url, direct_url=direct_url, error=None)
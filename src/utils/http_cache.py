@@ -0,0 +1,48 @@
+"""
+Conditional GET helpers (ETag / If-None-Match) for FastAPI routes.
+
+Responses are authenticated, so they are marked private: browsers may keep them but must
+revalidate, and shared proxies must not store them.
+"""
+
+import hashlib
+
+from pydantic import BaseModel
+from starlette.requests import Request
+from starlette.responses import Response
+
+CACHE_CONTROL = "private, no-cache"
+
+
+def compute_etag(payload: BaseModel) -> str:
+    """
+    Build a quoted ETag from a response model's content.
+
+    The serialized model is hashed rather than e.g. updated_at, since not every change to
+    a row is guaranteed to bump its timestamp.
+    """
+    digest = hashlib.md5(payload.model_dump_json().encode(), usedforsecurity=False).hexdigest()
+    return f'"{digest}"'
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    """Return True if the request's If-None-Match header matches etag (weak comparison)."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in header.split(","))
+
+
+def set_cache_headers(response: Response, etag: str) -> None:
+    """Attach the ETag and revalidation policy to a response."""
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
+
+
+def not_modified_response(etag: str) -> Response:
+    """Empty 304 response carrying the same validators as the full response."""
+    response = Response(status_code=304)
+    set_cache_headers(response, etag)
+    return response
@@ -5,28 +5,83 @@ Intended for low-volume public endpoints; not suitable for multi-instance deploy
 without a shared store. For production scale, replace with Redis/Cloudflare/etc.
 """
 
-import time
-from collections import deque
-from typing import Deque, Dict, Tuple
+import asyncio
+from dataclasses import dataclass
+from time import monotonic_ns as _now
+from typing import Callable, Dict, List, Literal, Tuple, Union, cast
 
 from fastapi import HTTPException, status
 from starlette.requests import Request
 
-# key: (ip, bucket) -> deque[timestamps]
-_requests: Dict[Tuple[str, str], Deque[float]] = {}
+
+@dataclass(slots=True)
+class _Window:
+    """Timestamps of the last `limit` allowed requests, kept in a fixed-size ring."""
+
+    buf: List[int]  # monotonic timestamps in nanoseconds
+    head: int = 0  # next slot to write; once full, also the oldest timestamp
+    count: int = 0
+
+
+@dataclass(slots=True)
+class _TokenBucket:
+    """Tokens left for one client, refilled continuously at limit / window_seconds."""
+
+    tokens: float
+    last: int  # monotonic nanoseconds of the last refill
+
+
+RateLimitMode = Literal["sliding_window", "token_bucket"]
+
+# bucket -> ip -> per-client state. Each rate_limit() dependency closes over its bucket's
+# dict, so requests only touch the state of their own bucket.
+_buckets: Dict[str, Dict[str, Union[_Window, _TokenBucket]]] = {}
+# bucket -> (window_seconds, sweep). The reaper calls each sweep to drop clients with no
+# request inside window_seconds, so clients rotating through many IPs can't grow the dicts
+# without bound. Requests themselves never sweep.
+_sweepers: Dict[str, Tuple[int, Callable[[int], None]]] = {}
+
+# bucket -> (limit, mode), so a bucket shared by several routes keeps one kind of state
+_bucket_settings: Dict[str, Tuple[int, str]] = {}
 
 
 def reset_rate_limits(bucket: str | None = None) -> None:
     """Testing/helper utility to clear stored counters."""
+    # Clear in place: dependencies hold references to the per-bucket dicts
     if bucket is None:
-        _requests.clear()
+        for windows in _buckets.values():
+            windows.clear()
         return
-    to_delete = [key for key in _requests if key[1] == bucket]
-    for key in to_delete:
-        _requests.pop(key, None)
+    bucket_windows = _buckets.get(bucket)
+    if bucket_windows is not None:
+        bucket_windows.clear()
+
+
+def sweep_idle_clients() -> None:
+    """Drop clients that have been idle for a full window from every bucket."""
+    now = _now()
+    for window_seconds, sweep in list(_sweepers.values()):
+        sweep(now - window_seconds * 1_000_000_000)
+
 
+async def _reaper_loop(interval: float) -> None:
+    while True:
+        await asyncio.sleep(interval)
+        # Synchronous: no other request runs on the event loop while a sweep is in progress
+        sweep_idle_clients()
+
+
+def start_reaper() -> "asyncio.Task[None]":
+    """
+    Start sweeping idle clients in the background, once per shortest bucket window.
 
-def rate_limit(bucket: str, limit: int, window_seconds: int = 60):
+    Call from the application lifespan and cancel the returned task on shutdown.
+    """
+    interval = max(min((window for window, _ in _sweepers.values()), default=60), 1)
+    return asyncio.create_task(_reaper_loop(interval))
+
+
+def rate_limit(bucket: str, limit: int, window_seconds: int = 60, mode: RateLimitMode = "sliding_window"):
     """
     Dependency factory for rate limiting.
 
@@ -34,29 +89,75 @@ def rate_limit(bucket: str, limit: int, window_seconds: int = 60):
         bucket: logical bucket name (e.g., "public_register")
         limit: max requests allowed in the window
         window_seconds: rolling window size in seconds
+        mode: "sliding_window" (exact; keeps `limit` timestamps per client) or
+              "token_bucket" (two numbers per client; allows bursts of `limit`, then
+              limit / window_seconds requests per second). Prefer token_bucket for large limits.
+
+    Raises:
+        ValueError: If the bucket is already used with a different limit or mode
     """
+    if _bucket_settings.setdefault(bucket, (limit, mode)) != (limit, mode):
+        raise ValueError(f"Rate limit bucket {bucket!r} already uses limit/mode {_bucket_settings[bucket]}")
+    windows = _buckets.setdefault(bucket, {})
+    window_ns = window_seconds * 1_000_000_000
+    refill_per_ns = limit / window_ns if window_ns else float("inf")
 
-    async def _enforce(request: Request):
-        ip = request.client.host if request.client else "unknown"
-        key = (ip, bucket)
-        now = time.time()
-        window_start = now - window_seconds
+    def _last_seen(state: Union[_Window, _TokenBucket]) -> int:
+        if isinstance(state, _TokenBucket):
+            return state.last  # a full window later the bucket is full again
+        return state.buf[(state.head - 1) % limit] if state.count else -1
+
+    def _sweep(window_start: int) -> None:
+        idle = [ip for ip, state in windows.items() if _last_seen(state) < window_start]
+        for ip in idle:
+            del windows[ip]
+
+    _sweepers[bucket] = (window_seconds, _sweep)
 
-        q = _requests.get(key)
-        if q is None:
-            q = deque()
-            _requests[key] = q
+    # A bucket only ever holds one kind of state (enforced by _bucket_settings above)
+    ring_windows = cast(Dict[str, _Window], windows)
+    token_buckets = cast(Dict[str, _TokenBucket], windows)
 
-        # drop old entries
-        while q and q[0] < window_start:
-            q.popleft()
+    def _admit_sliding_window(ip: str, now: int, window_start: int) -> bool:
+        window = ring_windows.get(ip)
+        if window is None:
+            window = _Window(buf=[0] * limit)
+            ring_windows[ip] = window
 
-        if len(q) >= limit:
+        # Full ring whose oldest entry is still inside the window: `limit` requests already
+        # happened within window_seconds
+        if window.count >= limit and (limit == 0 or window.buf[window.head] >= window_start):
+            return False
+
+        window.buf[window.head] = now
+        window.head = (window.head + 1) % limit
+        window.count = min(window.count + 1, limit)
+        return True
+
+    def _admit_token_bucket(ip: str, now: int, window_start: int) -> bool:
+        state = token_buckets.get(ip)
+        if state is None:
+            state = _TokenBucket(tokens=float(limit), last=now)
+            token_buckets[ip] = state
+
+        state.tokens = min(float(limit), state.tokens + (now - state.last) * refill_per_ns)
+        state.last = now
+        if state.tokens < 1:
+            return False
+        state.tokens -= 1
+        return True
+
+    admit = _admit_token_bucket if mode == "token_bucket" else _admit_sliding_window
+
+    async def _enforce(request: Request):
+        # Read the ASGI scope directly; request.client builds an Address tuple on every access
+        client = request.scope.get("client")
+        ip = client[0] if client else "unknown"
+        now = _now()  # monotonic: NTP/wall-clock jumps can't stretch or shrink the window
+        if not admit(ip, now, now - window_ns):
             raise HTTPException(
                 status_code=status.HTTP_429_TOO_MANY_REQUESTS,
                 detail="Rate limit exceeded. Please wait and try again.",
             )
 
-        q.append(now)
-
     return _enforce
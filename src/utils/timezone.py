@@ -2,10 +2,21 @@
 Timezone conversion utilities for formatting datetimes to Toronto timezone.
 """
 
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Optional
+from zoneinfo import ZoneInfo
 
-import pytz
+TORONTO_TZ = ZoneInfo("America/Toronto")
+
+# Default format: "Wednesday, January 15, 2025 at 6:00 PM EST"
+DEFAULT_FORMAT = "%A, %B %d, %Y at %-I:%M %p %Z"
+
+
+@lru_cache(maxsize=1024)
+def _format_default(epoch_minute: int) -> str:
+    """Default-format a minute in Toronto time; emails format the same event time once per recipient."""
+    return datetime.fromtimestamp(epoch_minute * 60, TORONTO_TZ).strftime(DEFAULT_FORMAT)
 
 
 def format_datetime_toronto(dt: datetime, format_str: Optional[str] = None) -> str:
@@ -26,19 +37,14 @@ def format_datetime_toronto(dt: datetime, format_str: Optional[str] = None) -> s
         >>> format_datetime_toronto(dt)
         'Wednesday, January 15, 2025 at 6:00 PM EST'
     """
-    toronto_tz = pytz.timezone("America/Toronto")
-
     # If datetime is naive, assume UTC
-    if dt.tzinfo is None:
-        utc_dt = pytz.utc.localize(dt)
-    else:
-        utc_dt = dt
-
-    # Convert to Toronto timezone
-    toronto_dt = utc_dt.astimezone(toronto_tz)
+    utc_dt = dt.replace(tzinfo=timezone.utc) if dt.tzinfo is None else dt
 
-    # Default format: "Wednesday, January 15, 2025 at 6:00 PM EST"
+    # The default format has minute resolution, so it can be cached per minute
     if format_str is None:
-        format_str = "%A, %B %d, %Y at %-I:%M %p %Z"
+        return _format_default(int(utc_dt.timestamp() // 60))
+
+    # Convert to Toronto timezone (nothing to do if it's already in Toronto time)
+    toronto_dt = utc_dt if utc_dt.tzinfo is TORONTO_TZ else utc_dt.astimezone(TORONTO_TZ)
 
     return toronto_dt.strftime(format_str)
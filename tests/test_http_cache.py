@@ -0,0 +1,64 @@
+from fastapi import FastAPI, Request, Response
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from utils.http_cache import compute_etag, is_not_modified, not_modified_response, set_cache_headers  # type: ignore
+
+
+class Item(BaseModel):
+    name: str
+
+
+def build_app():
+    app = FastAPI()
+    state = {"name": "first"}
+
+    @app.get("/item", response_model=Item)
+    async def get_item(request: Request, response: Response):
+        item = Item(name=state["name"])
+        etag = compute_etag(item)
+        if is_not_modified(request, etag):
+            return not_modified_response(etag)
+        set_cache_headers(response, etag)
+        return item
+
+    return app, state
+
+
+def test_etag_is_stable_and_content_dependent():
+    assert compute_etag(Item(name="a")) == compute_etag(Item(name="a"))
+    assert compute_etag(Item(name="a")) != compute_etag(Item(name="b"))
+
+
+def test_response_carries_etag_and_private_cache_control():
+    app, _ = build_app()
+    response = TestClient(app).get("/item")
+    assert response.status_code == 200
+    assert response.headers["etag"] == compute_etag(Item(name="first"))
+    assert response.headers["cache-control"] == "private, no-cache"
+
+
+def test_matching_if_none_match_returns_304():
+    app, _ = build_app()
+    client = TestClient(app)
+    etag = client.get("/item").headers["etag"]
+
+    response = client.get("/item", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+
+    # Weak validators and lists of tags also match
+    assert client.get("/item", headers={"If-None-Match": f'"other", W/{etag}'}).status_code == 304
+
+
+def test_changed_content_returns_full_response():
+    app, state = build_app()
+    client = TestClient(app)
+    etag = client.get("/item").headers["etag"]
+
+    state["name"] = "second"
+    response = client.get("/item", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json() == {"name": "second"}
+    assert response.headers["etag"] != etag
@@ -24,3 +24,39 @@ def test_health_check():
     assert response.status_code == 200
     data = response.json()
     assert data["status"] == "healthy"
+
+
+def test_openapi_and_docs():
+    """Test the cached OpenAPI schema and the docs pages that load it."""
+    from core.config import get_settings
+
+    prefix = get_settings().API_V1_PREFIX
+    response = client.get(f"{prefix}/openapi.json")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    schema = response.json()
+    assert schema == app.openapi()
+    assert f"{prefix}/docs" not in schema["paths"]
+
+    for page in ("docs", "redoc"):
+        response = client.get(f"{prefix}/{page}")
+        assert response.status_code == 200
+        assert f"{prefix}/openapi.json" in response.text
+
+
+def test_cors_preflight():
+    """Test that preflight requests allow the headers the frontend sends."""
+    from core.config import get_settings
+
+    origin = get_settings().ALLOWED_ORIGINS[0]
+    response = client.options(
+        "/health",
+        headers={
+            "Origin": origin,
+            "Access-Control-Request-Method": "PUT",
+            "Access-Control-Request-Headers": "authorization, content-type",
+        },
+    )
+    assert response.status_code == 200
+    assert response.headers["access-control-allow-origin"] == origin
+    assert "Authorization" in response.headers["access-control-allow-headers"]
@@ -4,7 +4,10 @@ import pytest
 from fastapi import Depends, FastAPI
 from fastapi.testclient import TestClient
 
-from utils.rate_limit import rate_limit, reset_rate_limits  # type: ignore
+import utils.rate_limit as rate_limit_module  # type: ignore
+from utils.rate_limit import rate_limit, reset_rate_limits, sweep_idle_clients  # type: ignore
+
+SECOND = 1_000_000_000  # rate_limit._now returns nanoseconds
 
 
 def build_app():
@@ -51,3 +54,118 @@ async def test_rate_limit_resets_after_window(monkeypatch):
     assert client.get("/short").status_code == 200
     await asyncio.sleep(0.05)
     assert client.get("/short").status_code == 200
+
+
+def test_rate_limit_window_slides(monkeypatch):
+    app = FastAPI()
+
+    @app.get("/sliding", dependencies=[Depends(rate_limit("sliding_bucket", limit=2, window_seconds=10))])
+    async def sliding():
+        return {"ok": True}
+
+    client = TestClient(app)
+    clock = {"now": 1000 * SECOND}
+    monkeypatch.setattr("utils.rate_limit._now", lambda: clock["now"])
+
+    assert client.get("/sliding").status_code == 200  # t=1000
+    clock["now"] = 1005 * SECOND
+    assert client.get("/sliding").status_code == 200  # t=1005
+    assert client.get("/sliding").status_code == 429
+
+    # First request has left the window, second has not: exactly one more is allowed
+    clock["now"] = 10105 * SECOND // 10
+    assert client.get("/sliding").status_code == 200
+    assert client.get("/sliding").status_code == 429
+
+    clock["now"] = 10155 * SECOND // 10
+    assert client.get("/sliding").status_code == 200
+
+
+def test_reset_only_clears_named_bucket():
+    app = FastAPI()
+
+    @app.get("/a", dependencies=[Depends(rate_limit("bucket_a", limit=1, window_seconds=60))])
+    async def a():
+        return {"ok": True}
+
+    @app.get("/b", dependencies=[Depends(rate_limit("bucket_b", limit=1, window_seconds=60))])
+    async def b():
+        return {"ok": True}
+
+    client = TestClient(app)
+    assert client.get("/a").status_code == 200
+    assert client.get("/b").status_code == 200
+
+    reset_rate_limits("bucket_a")
+    assert client.get("/a").status_code == 200
+    assert client.get("/b").status_code == 429
+
+
+def test_bucket_limit_must_be_consistent():
+    rate_limit("consistent_bucket", limit=3)
+    rate_limit("consistent_bucket", limit=3)
+    with pytest.raises(ValueError):
+        rate_limit("consistent_bucket", limit=4)
+    with pytest.raises(ValueError):
+        rate_limit("consistent_bucket", limit=3, mode="token_bucket")
+
+
+def test_idle_clients_are_swept(monkeypatch):
+    app = FastAPI()
+
+    @app.get("/swept", dependencies=[Depends(rate_limit("swept_bucket", limit=1, window_seconds=10))])
+    async def swept():
+        return {"ok": True}
+
+    clock = {"now": 1000 * SECOND}
+    monkeypatch.setattr("utils.rate_limit._now", lambda: clock["now"])
+
+    for i in range(3):
+        assert TestClient(app, client=(f"10.0.0.{i}", 1)).get("/swept").status_code == 200
+    clock["now"] = 1005 * SECOND
+    assert TestClient(app, client=("10.0.0.9", 1)).get("/swept").status_code == 200
+
+    # Requests don't sweep; the reaper drops only clients idle for the whole window
+    clock["now"] = 1012 * SECOND
+    assert len(rate_limit_module._buckets["swept_bucket"]) == 4
+    sweep_idle_clients()
+    assert set(rate_limit_module._buckets["swept_bucket"]) == {"10.0.0.9"}
+    assert TestClient(app, client=("10.0.0.9", 1)).get("/swept").status_code == 429
+
+
+@pytest.mark.asyncio
+async def test_reaper_loop_sweeps_until_cancelled(monkeypatch):
+    sweeps = []
+
+    def fake_sweep():
+        sweeps.append(True)
+        if len(sweeps) == 2:
+            raise asyncio.CancelledError
+
+    monkeypatch.setattr("utils.rate_limit.sweep_idle_clients", fake_sweep)
+
+    with pytest.raises(asyncio.CancelledError):
+        await rate_limit_module._reaper_loop(0)
+    assert len(sweeps) == 2
+
+
+def test_token_bucket_allows_burst_then_refills(monkeypatch):
+    app = FastAPI()
+    limiter = rate_limit("token_bucket_test", limit=2, window_seconds=10, mode="token_bucket")
+
+    @app.get("/tokens", dependencies=[Depends(limiter)])
+    async def tokens():
+        return {"ok": True}
+
+    client = TestClient(app)
+    clock = {"now": 1000 * SECOND}
+    monkeypatch.setattr("utils.rate_limit._now", lambda: clock["now"])
+
+    assert client.get("/tokens").status_code == 200
+    assert client.get("/tokens").status_code == 200
+    assert client.get("/tokens").status_code == 429
+
+    # Refill rate is 2 tokens / 10 s, so one token is back after 5 s
+    clock["now"] = 1005 * SECOND
+    assert client.get("/tokens").status_code == 200
+    assert client.get("/tokens").status_code == 429
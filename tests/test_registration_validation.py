@@ -1,3 +1,8 @@
+from datetime import datetime, timezone
+from uuid import UUID
+
+import pytest
+
 from domains.events.registrations.models import FileMeta
 from domains.events.registrations.service import RegistrationService
 
@@ -19,138 +24,104 @@ class ValidationOnlyService(RegistrationService):
         pass
 
 
+@pytest.fixture(scope="session")
+def validation_service():
+    """One ValidationOnlyService for the whole run; validate_form_data and _extract_name keep no state."""
+    return ValidationOnlyService()
+
+
+# Constant FileMeta fields, already in their parsed types so make_file can skip validation
+_BASE_FILE_META = {
+    "id": UUID("00000000-0000-0000-0000-000000000001"),
+    "registration_id": None,
+    "event_id": UUID("00000000-0000-0000-0000-000000000002"),
+    "file_url": "https://example.com/file.pdf",
+    "file_name": "file.pdf",
+    "upload_session_id": "session",
+    "uploaded_at": datetime(2024, 1, 1, tzinfo=timezone.utc),
+    "scheduled_deletion_date": None,
+    "deleted": False,
+    "deleted_at": None,
+}
+
+
+# Form schemas shared by the tests; validate_form_data only reads them
+_RESUME_VALIDATION = {"maxSize": 1_000_000, "allowedTypes": ["application/pdf"]}
+_FULL_NAME_SCHEMA = {"fields": [{"id": "full_name", "type": "text", "required": True}]}
+_FULL_NAME_CAMELCASE_SCHEMA = {"fields": [{"id": "fullName", "type": "text", "required": True}]}
+_SIZE_SCHEMA = {"fields": [{"id": "size", "type": "select", "required": True, "options": ["S", "M", "L"]}]}
+_RESUME_SCHEMA = {"fields": [{"id": "resume", "type": "file", "required": True, "validation": _RESUME_VALIDATION}]}
+_APPLICATION_SCHEMA = {
+    "fields": [
+        {"id": "full_name", "type": "text", "required": True},
+        {"id": "resume", "type": "file", "required": False, "validation": _RESUME_VALIDATION},
+    ]
+}
+
+
 def make_file(field_name: str, size: int, mime: str) -> FileMeta:
-    return FileMeta.model_validate(
-        {
-            "id": "00000000-0000-0000-0000-000000000001",
-            "registration_id": None,
-            "event_id": "00000000-0000-0000-0000-000000000002",
-            "field_name": field_name,
-            "file_url": "https://example.com/file.pdf",
-            "file_name": "file.pdf",
-            "file_size": size,
-            "mime_type": mime,
-            "upload_session_id": "session",
-            "uploaded_at": "2024-01-01T00:00:00Z",
-            "scheduled_deletion_date": None,
-            "deleted": False,
-            "deleted_at": None,
-        }
-    )
+    return FileMeta.model_construct(**_BASE_FILE_META, field_name=field_name, file_size=size, mime_type=mime)
+
 
+# Uploaded files keyed by field, as validate_form_data receives them
+_OVERSIZED_RESUME = {"resume": [make_file("resume", size=2_000_000, mime="application/pdf")]}
+_WRONG_TYPE_RESUME = {"resume": [make_file("resume", size=500_000, mime="application/msword")]}
+_VALID_RESUME = {"resume": [make_file("resume", size=500_000, mime="application/pdf")]}
 
-def test_required_text_field():
-    service = ValidationOnlyService()
-    form_schema = {"fields": [{"id": "full_name", "type": "text", "required": True}]}
-    errors = service.validate_form_data(form_data={}, form_schema=form_schema, files_by_field={})
+
+def test_required_text_field(validation_service):
+    errors = validation_service.validate_form_data(form_data={}, form_schema=_FULL_NAME_SCHEMA, files_by_field={})
     assert errors and errors[0]["field"] == "full_name"
 
 
-def test_choice_validation():
-    service = ValidationOnlyService()
-    form_schema = {
-        "fields": [
-            {
-                "id": "size",
-                "type": "select",
-                "required": True,
-                "options": ["S", "M", "L"],
-            }
-        ]
-    }
-    errors = service.validate_form_data(form_data={"size": "XL"}, form_schema=form_schema, files_by_field={})
+def test_choice_validation(validation_service):
+    errors = validation_service.validate_form_data(
+        form_data={"size": "XL"}, form_schema=_SIZE_SCHEMA, files_by_field={}
+    )
     assert errors and "allowed options" in errors[0]["message"]
 
 
-def test_file_validation_size_and_type():
-    service = ValidationOnlyService()
-    form_schema = {
-        "fields": [
-            {
-                "id": "resume",
-                "type": "file",
-                "required": True,
-                "validation": {"maxSize": 1_000_000, "allowedTypes": ["application/pdf"]},
-            }
-        ]
-    }
-    files_by_field = {
-        "resume": [make_file("resume", size=2_000_000, mime="application/pdf")],
-    }
-    errors = service.validate_form_data(form_data={}, form_schema=form_schema, files_by_field=files_by_field)
+def test_file_validation_size_and_type(validation_service):
+    errors = validation_service.validate_form_data(
+        form_data={}, form_schema=_RESUME_SCHEMA, files_by_field=_OVERSIZED_RESUME
+    )
     assert errors and "must be <=" in errors[0]["message"]
 
-    files_by_field = {
-        "resume": [make_file("resume", size=500_000, mime="application/msword")],
-    }
-    errors = service.validate_form_data(form_data={}, form_schema=form_schema, files_by_field=files_by_field)
+    errors = validation_service.validate_form_data(
+        form_data={}, form_schema=_RESUME_SCHEMA, files_by_field=_WRONG_TYPE_RESUME
+    )
     assert errors and "must be one of" in errors[0]["message"]
 
 
-def test_passes_valid_payload():
-    service = ValidationOnlyService()
-    form_schema = {
-        "fields": [
-            {"id": "full_name", "type": "text", "required": True},
-            {
-                "id": "resume",
-                "type": "file",
-                "required": False,
-                "validation": {"maxSize": 1_000_000, "allowedTypes": ["application/pdf"]},
-            },
-        ]
-    }
-    files_by_field = {
-        "resume": [make_file("resume", size=500_000, mime="application/pdf")],
-    }
-    errors = service.validate_form_data(
-        form_data={"full_name": "Jane Doe"}, form_schema=form_schema, files_by_field=files_by_field
+def test_passes_valid_payload(validation_service):
+    errors = validation_service.validate_form_data(
+        form_data={"full_name": "Jane Doe"}, form_schema=_APPLICATION_SCHEMA, files_by_field=_VALID_RESUME
     )
     assert errors == []
 
 
-def test_required_text_field_camelcase():
+def test_required_text_field_camelcase(validation_service):
     """Test camelCase field name validation."""
-    service = ValidationOnlyService()
-    form_schema = {"fields": [{"id": "fullName", "type": "text", "required": True}]}
-    errors = service.validate_form_data(form_data={}, form_schema=form_schema, files_by_field={})
+    errors = validation_service.validate_form_data(
+        form_data={}, form_schema=_FULL_NAME_CAMELCASE_SCHEMA, files_by_field={}
+    )
     assert errors and errors[0]["field"] == "fullName"
 
 
-def test_extract_name_camelcase():
-    """Test name extraction with camelCase fields."""
-    service = ValidationOnlyService()
-
-    # Test fullName
-    form_data = {"fullName": "Jane Doe"}
-    assert service._extract_name(form_data) == "Jane Doe"
-
-    # Test firstName + lastName
-    form_data = {"firstName": "Jane", "lastName": "Doe"}
-    assert service._extract_name(form_data) == "Jane Doe"
-
-
-def test_extract_name_legacy_snake_case():
-    """Test name extraction with legacy snake_case fields still works."""
-    service = ValidationOnlyService()
-
-    # Test full_name
-    form_data = {"full_name": "Jane Doe"}
-    assert service._extract_name(form_data) == "Jane Doe"
-
-    # Test first_name + last_name
-    form_data = {"first_name": "Jane", "last_name": "Doe"}
-    assert service._extract_name(form_data) == "Jane Doe"
-
-
-def test_extract_name_priority():
-    """Test that camelCase takes priority over snake_case."""
-    service = ValidationOnlyService()
-
-    # When both exist, camelCase should win
-    form_data = {"fullName": "Camel Case", "full_name": "Snake Case"}
-    assert service._extract_name(form_data) == "Camel Case"
-
-    # When both exist for first/last name, camelCase should win
-    form_data = {"firstName": "Camel", "lastName": "Case", "first_name": "Snake", "last_name": "Case"}
-    assert service._extract_name(form_data) == "Camel Case"
+@pytest.mark.parametrize(
+    ("form_data", "expected"),
+    [
+        ({"fullName": "Jane Doe"}, "Jane Doe"),
+        ({"firstName": "Jane", "lastName": "Doe"}, "Jane Doe"),
+        # Legacy snake_case fields still work
+        ({"full_name": "Jane Doe"}, "Jane Doe"),
+        ({"first_name": "Jane", "last_name": "Doe"}, "Jane Doe"),
+        # When both exist, camelCase should win
+        ({"fullName": "Camel Case", "full_name": "Snake Case"}, "Camel Case"),
+        ({"firstName": "Camel", "lastName": "Case", "first_name": "Snake", "last_name": "Case"}, "Camel Case"),
+    ],
+    ids=["camel_full", "camel_first_last", "snake_full", "snake_first_last", "full_priority", "first_last_priority"],
+)
+def test_extract_name(validation_service, form_data, expected):
+    """Test name extraction from camelCase and legacy snake_case fields, camelCase first."""
+    assert validation_service._extract_name(form_data) == expected
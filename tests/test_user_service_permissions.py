@@ -0,0 +1,77 @@
+import itertools
+from types import SimpleNamespace
+from uuid import UUID
+
+import pytest
+from fastapi import HTTPException
+
+from domains.users.models import UpdateUserRequest
+from domains.users.service import UserService
+
+# RUN TESTS:
+# export PYTHONPATH=$PYTHONPATH:$(pwd)/src
+# pytest tests/test_user_service_permissions.py
+
+DEPT_A = UUID("00000000-0000-0000-0000-00000000000a")
+DEPT_B = UUID("00000000-0000-0000-0000-00000000000b")
+ROLES = ["co_president", "vp", "director"]
+DEPARTMENTS = [DEPT_A, DEPT_B, None]
+
+
+class PermissionsOnlyService(UserService):
+    """Skip __init__ so no Supabase client is created; only permission helpers are used."""
+
+    def __init__(self):
+        pass
+
+
+def matches(target, guards) -> bool:
+    """Evaluate (column, operator, value) guards the way PostgREST would."""
+    if guards is None:
+        return False
+    for column, operator, value in guards:
+        actual = getattr(target, column)
+        actual = str(actual) if actual is not None else None
+        if operator == "eq" and actual != value:
+            return False
+        if operator == "neq" and actual == value:
+            return False
+        if operator == "in" and actual not in value.strip("()").split(","):
+            return False
+    return True
+
+
+def allowed(check, *args) -> bool:
+    try:
+        check(*args)
+    except HTTPException:
+        return False
+    return True
+
+
+@pytest.mark.parametrize(
+    "current_role,current_dept,target_role,target_dept",
+    list(itertools.product(ROLES, DEPARTMENTS, ROLES, DEPARTMENTS)),
+)
+def test_update_guards_match_permission_checks(current_role, current_dept, target_role, target_dept):
+    service = PermissionsOnlyService()
+    current = SimpleNamespace(role=current_role, department_id=current_dept)
+    target = SimpleNamespace(role=target_role, department_id=target_dept)
+
+    for new_role, new_dept in itertools.product([None, *ROLES], [None, DEPT_A, DEPT_B]):
+        request = UpdateUserRequest(first_name="Ada", role=new_role, department_id=new_dept)
+        expected = allowed(service._validate_update_permissions, request, current, target)
+        assert matches(target, service._update_guards(request, current)) == expected
+
+
+@pytest.mark.parametrize(
+    "current_role,current_dept,target_role,target_dept",
+    list(itertools.product(ROLES, DEPARTMENTS, ROLES, DEPARTMENTS)),
+)
+def test_delete_guards_match_permission_checks(current_role, current_dept, target_role, target_dept):
+    service = PermissionsOnlyService()
+    current = SimpleNamespace(role=current_role, department_id=current_dept)
+    target = SimpleNamespace(role=target_role, department_id=target_dept)
+
+    expected = allowed(service._validate_delete_permissions, current, target)
+    assert matches(target, service._management_guards(current)) == expected